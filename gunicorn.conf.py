@@ -0,0 +1,41 @@
+"""
+Gunicorn configuration for production deployment.
+Per PERFORMANCE_RECOMMENDATIONS.md (I/O-bound request path).
+
+Each /api/chat request spends almost all of its time waiting on Oracle
+and Ollama. Sync workers serve one request at a time, so threaded
+(gthread) workers are used: each worker serves up to `threads` requests
+concurrently, and both oracledb (OCI calls) and requests release the GIL
+while waiting on the network.
+
+Usage:
+    gunicorn -c gunicorn.conf.py "app:create_app()"
+
+Notes:
+- Not gevent: DBConnectionPool runs oracledb in thick mode
+  (init_oracle_client), whose blocking C calls cannot yield to the gevent
+  hub, so one slow query would stall every greenlet in the worker.
+  Monkey patching would also turn the executor threads into greenlets.
+- preload_app stays False: create_app() starts background threads
+  (Ollama warm-up) that would not survive the fork.
+- Flask-Limiter defaults to memory:// storage, so rate limits are per
+  worker unless RATELIMIT_STORAGE_URI points at Redis.
+"""
+
+import os
+
+bind = os.getenv("GUNICORN_BIND", "127.0.0.1:5000")
+workers = int(os.getenv("GUNICORN_WORKERS", "4"))
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "16"))
+
+preload_app = False
+
+# Ollama summaries can take well over the 30s default
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
+
+accesslog = "-"
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
@@ -4,8 +4,10 @@ Per AGENTS.md § 4 (Control Catalog Rules).
 """
 
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 from pydantic import ValidationError
 
@@ -38,6 +40,8 @@ class ControlCatalog:
         self.catalog_dir = Path(catalog_dir)
         self.controls: Dict[str, ControlDefinition] = {}
         self.metadata: Dict = {}
+        # Catalog is immutable after load: snapshot once for per-request callers
+        self._all_controls: Tuple[ControlDefinition, ...] = ()
 
         self._load_catalog()
 
@@ -91,15 +95,16 @@ class ControlCatalog:
             error_msg = "\n".join(errors)
             raise CatalogLoadError(f"Catalog validation failed:\n{error_msg}")
 
+        self._all_controls = tuple(self.controls.values())
         logger.info(f"✓ Catalog loaded: {loaded_count} controls")
 
     def get_control(self, control_id: str) -> Optional[ControlDefinition]:
         """Get a control by ID"""
         return self.controls.get(control_id)
 
-    def get_all_controls(self) -> List[ControlDefinition]:
-        """Get all controls"""
-        return list(self.controls.values())
+    def get_all_controls(self) -> Tuple[ControlDefinition, ...]:
+        """Get all controls (shared immutable snapshot, built once at load)"""
+        return self._all_controls
 
     def get_controls_by_intent(self, intent: str) -> List[ControlDefinition]:
         """Get all controls for a specific intent"""
@@ -165,10 +170,30 @@ class ControlCatalog:
         )
 
 
+# Loaded catalogs by resolved directory: (files fingerprint, catalog)
+_catalog_cache: Dict[str, Tuple[tuple, ControlCatalog]] = {}
+_catalog_cache_lock = threading.Lock()
+
+
+def _catalog_fingerprint(catalog_dir: str) -> tuple:
+    """(name, mtime_ns, size) of every JSON file; changes when any file does."""
+    with os.scandir(catalog_dir) as entries:
+        # DirEntry caches its stat() result, so each file is stat'ed once
+        return tuple(sorted(
+            (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+            for entry in entries
+            if entry.name.endswith(".json")
+        ))
+
+
 def load_catalog(catalog_dir: str) -> ControlCatalog:
     """
     Load and validate control catalog.
     
+    The catalog is immutable after load, so one instance per directory is
+    reused until a control file is added, removed or modified (checked by
+    a stat() of each file instead of re-parsing and re-validating them).
+    
     Args:
         catalog_dir: Path to controls directory
         
@@ -178,4 +203,18 @@ def load_catalog(catalog_dir: str) -> ControlCatalog:
     Raises:
         CatalogLoadError: If loading or validation fails
     """
-    return ControlCatalog(catalog_dir)
+    key = str(Path(catalog_dir).resolve())
+    try:
+        fingerprint = _catalog_fingerprint(key)
+    except OSError:
+        fingerprint = None  # Missing dir: let ControlCatalog raise
+
+    with _catalog_cache_lock:
+        cached = _catalog_cache.get(key)
+        if fingerprint is not None and cached and cached[0] == fingerprint:
+            return cached[1]
+
+        catalog = ControlCatalog(catalog_dir)
+        if fingerprint is not None:
+            _catalog_cache[key] = (fingerprint, catalog)
+        return catalog
@@ -206,7 +206,7 @@ class ControlExecutionResult(BaseModel):
     query_results: List[QueryExecutionResult] = Field(
         ..., description="Results from all queries"
     )
-    total_execution_time_ms: float = Field(..., description="Total time for all queries")
+    total_execution_time_ms: float = Field(..., description="Wall-clock time for all queries (they may overlap)")
     has_errors: bool = Field(..., description="True if any query failed")
     errors: List[str] = Field(
         default_factory=list, description="List of error messages from failed queries"
@@ -9,13 +9,16 @@ Enforces:
 - Result sanitization before LLM
 """
 
+import functools
 import logging
 import re
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 import oracledb
 
+from src.db.connection import DBConnectionPool
 from src.db.sanitizer import Sanitizer
 from src.controls.schema import QueryExecutionResult, ControlExecutionResult
 from src.observability.log_sanitizer import safe_log_value
@@ -54,11 +57,38 @@ class QueryExecutor:
         "COMMIT",
         "ROLLBACK",
         "BEGIN",
+        "MERGE",
+        "EXEC",
+        "EXECUTE",
     ]
 
+    # All forbidden keywords as one word-bounded alternation, compiled once
+    # (one scan of the SQL instead of one regex search per keyword)
+    FORBIDDEN_PATTERN = re.compile(r"\b(?:" + "|".join(FORBIDDEN_KEYWORDS) + r")\b")
+
+    # ISO formats accepted for date/datetime binds
+    DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+    DATETIME_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}")
+
     # Maximum payload size: 10MB
     MAX_PAYLOAD_BYTES = 10 * 1024 * 1024
 
+    # Queries of a multi-query control run concurrently, each on its own
+    # pooled connection. One control holds at most MAX_PARALLEL_QUERIES
+    # connections at a time, well below DBConnectionPool.POOL_SIZE (10), so
+    # a single control cannot take the whole pool.
+    MAX_PARALLEL_QUERIES = 3
+    # The query worker threads are shared by every request this executor
+    # serves and never hold more than POOL_SIZE connections between them.
+    # Single-query controls run inline on the request thread, so under load
+    # (gunicorn threads + workers) get_connection() can still wait up to
+    # DBConnectionPool.WAIT_TIMEOUT_SECONDS for a free connection.
+    QUERY_WORKERS = DBConnectionPool.POOL_SIZE
+
+    # Error codes raised when Connection.call_timeout expires
+    # (thick mode: ODPI-C, thin mode: python-oracledb)
+    CALL_TIMEOUT_CODES = frozenset({"DPI-1067", "DPY-4024"})
+
     def __init__(self, connection_pool):
         """
         Initialize executor with connection pool.
@@ -67,6 +97,11 @@ class QueryExecutor:
             connection_pool: DBConnectionPool instance
         """
         self.pool = connection_pool
+        # oracledb releases the GIL during network round-trips, so threads
+        # give real overlap between independent queries (see QUERY_WORKERS)
+        self._query_workers = ThreadPoolExecutor(
+            max_workers=self.QUERY_WORKERS, thread_name_prefix="ebs-query"
+        )
 
     def execute_query(
         self,
@@ -125,6 +160,8 @@ class QueryExecutor:
             # Create cursor with timeout
             cursor = conn.cursor()
             cursor.arraysize = min(100, row_limit + 1)  # Fetch slightly more to detect truncation
+            # Return the rows with the execute round trip (no separate fetch)
+            cursor.prefetchrows = row_limit + 1
 
             # Execute with binds (safe: oracledb handles binding)
             if binds:
@@ -138,35 +175,32 @@ class QueryExecutor:
 
             # Step 3: Fetch results with row limit
             # ====================================
-            rows_list = []
-            rows = cursor.fetchall()
-
-            if rows:
-                # Convert to list of dicts (column names from description)
-                col_names = [desc[0].lower() for desc in cursor.description]
-                for row_tuple in rows:
-                    row_dict = dict(zip(col_names, row_tuple))
-                    rows_list.append(row_dict)
+            # Fetch at most row_limit + 1 rows (the extra row only detects
+            # truncation) instead of pulling the whole result set over the
+            # network and discarding everything past the limit.
+            rows = cursor.fetchmany(row_limit + 1)
+            truncated = len(rows) > row_limit
 
-                    if len(rows_list) >= row_limit:
-                        break
+            rows = rows[:row_limit]
+            # Column names from description; rows stay tuples until the
+            # sanitizer builds dicts for the rows it keeps
+            col_names = [desc[0].lower() for desc in cursor.description] if rows else []
 
             execution_time_ms = (time.time() - start_time) * 1000
-            truncated = len(rows) > row_limit
 
             # Step 4: Sanitize results
             # ========================
-            sanitized = Sanitizer.sanitize_result(rows_list, result_schema)
+            sanitized = Sanitizer.sanitize_result_tuples(col_names, rows, result_schema)
 
             logger.info(
-                f"[{safe_query_id}] Success: {len(rows_list)} rows in {execution_time_ms:.2f}ms"
+                f"[{safe_query_id}] Success: {len(rows)} rows in {execution_time_ms:.2f}ms"
             )
 
             return QueryExecutionResult(
                 query_id=query_id,
                 rows=sanitized["rows"],
                 row_count=sanitized["row_count"],
-                truncated=sanitized["truncated"],
+                truncated=truncated or sanitized["truncated"],
                 execution_time_ms=execution_time_ms,
                 error=None,
             )
@@ -221,17 +255,29 @@ class QueryExecutor:
         safe_control_id = safe_log_value(control_id, max_length=50)
         logger.info(f"Executing control: {safe_control_id} (v{control_version})")
 
-        query_results = []
-        total_time = 0.0
-        has_errors = False
+        query_defs = [query.dict() for query in control_definition.queries]
+
+        start_time = time.perf_counter()
 
-        for query in control_definition.queries:
-            result = self.execute_query(query.dict(), binds=binds)
-            query_results.append(result)
-            total_time += result.execution_time_ms
+        # Queries are independent: run them concurrently on at most
+        # MAX_PARALLEL_QUERIES lanes, each lane running its share in order
+        # on one connection at a time
+        lane_count = min(len(query_defs), self.MAX_PARALLEL_QUERIES)
+        if lane_count > 1:
+            query_results = [None] * len(query_defs)
+            lanes = [range(lane, len(query_defs), lane_count) for lane in range(lane_count)]
+            lane_results = self._query_workers.map(
+                lambda lane: [self.execute_query(query_defs[i], binds=binds) for i in lane], lanes
+            )
+            for lane, results in zip(lanes, lane_results):
+                for i, result in zip(lane, results):
+                    query_results[i] = result
+        else:
+            query_results = [self.execute_query(query_def, binds=binds) for query_def in query_defs]
 
-            if result.error:
-                has_errors = True
+        # Wall time: concurrent queries overlap, so their sum would overstate it
+        total_time = (time.perf_counter() - start_time) * 1000
+        has_errors = any(result.error for result in query_results)
 
         # Collect all error messages from failed queries
         error_messages = [qr.error for qr in query_results if qr.error]
@@ -247,7 +293,9 @@ class QueryExecutor:
             sanitized=True,
         )
 
-    def _validate_sql(self, sql: str) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _validate_sql(sql: str) -> Optional[str]:
         """
         Validate SQL for read-only safety.
         
@@ -256,6 +304,9 @@ class QueryExecutor:
         - NO DML (DELETE, INSERT, UPDATE, TRUNCATE)
         - Only SELECT allowed
         
+        Control SQL is a fixed set of texts, so the verdict is cached per
+        statement instead of re-scanning it on every execution.
+        
         Returns:
             Error message if invalid, None if valid
         """
@@ -268,15 +319,13 @@ class QueryExecutor:
         if not sql_upper.startswith("SELECT"):
             return "Only SELECT statements are allowed (read-only enforcement)"
 
-        # Check for forbidden keywords
-        for keyword in self.FORBIDDEN_KEYWORDS:
-            # Use word boundary matching to avoid false positives
-            pattern = r"\b" + keyword + r"\b"
-            if re.search(pattern, sql_upper):
-                return (
-                    f"Forbidden SQL keyword detected: {keyword}. "
-                    f"Only SELECT is allowed."
-                )
+        # Check for forbidden keywords (word boundaries avoid false positives)
+        match = QueryExecutor.FORBIDDEN_PATTERN.search(sql_upper)
+        if match:
+            return (
+                f"Forbidden SQL keyword detected: {match.group()}. "
+                f"Only SELECT is allowed."
+            )
 
         return None
 
@@ -293,7 +342,11 @@ class QueryExecutor:
         Per AGENTS.md § 6.1 (Query Execution Limits):
         - Enforce timeout_seconds per query
         - Cancel query if timeout exceeded
-        - Thread-based implementation (works on Windows + Unix)
+        
+        oracledb cursors use Connection.call_timeout: the client library
+        interrupts the round trip and the database cancels the statement,
+        with no helper thread. Other cursors (test doubles) fall back to
+        a thread joined with the timeout.
         
         Args:
             cursor: Oracle cursor
@@ -305,6 +358,10 @@ class QueryExecutor:
             TimeoutError: If query exceeds timeout
             oracledb.DatabaseError: If query fails
         """
+        if isinstance(cursor, oracledb.Cursor):
+            QueryExecutor._execute_with_call_timeout(cursor, sql, binds, timeout_seconds)
+            return
+
         exception_holder = [None]
         
         def execute_target():
@@ -344,9 +401,10 @@ class QueryExecutor:
         if exception_holder[0]:
             raise exception_holder[0]
         
-        logger.debug(f"Query executed successfully within {timeout_seconds}s timeout")
+        logger.debug("Query executed successfully within %ss timeout", timeout_seconds)
 
-    def _validate_binds(self, binds: Dict[str, Any], bind_schema: List[Dict]) -> Dict[str, Any]:
+    @staticmethod
+    def _validate_binds(binds: Dict[str, Any], bind_schema: List[Dict]) -> Dict[str, Any]:
         """
         Validate bind parameters against schema with type checking.
         
@@ -399,7 +457,7 @@ class QueryExecutor:
 
             # Step 3: Type validation + safe conversion
             try:
-                validated_value = self._convert_bind_type(bind_value, bind_type, bind_name)
+                validated_value = QueryExecutor._convert_bind_type(bind_value, bind_type, bind_name)
                 validated_binds[bind_name] = validated_value
             except (ValueError, TypeError) as e:
                 raise QueryExecutionError(
@@ -409,7 +467,8 @@ class QueryExecutor:
 
         return validated_binds
 
-    def _convert_bind_type(self, value: Any, expected_type: str, param_name: str) -> Any:
+    @staticmethod
+    def _convert_bind_type(value: Any, expected_type: str, param_name: str) -> Any:
         """
         Convert bind value to expected type with validation.
         
@@ -482,12 +541,11 @@ class QueryExecutor:
             # oracledb will handle the conversion to Oracle DATE type
             if isinstance(value, str):
                 # Validate ISO format (basic check)
-                import re
                 if expected_type == "date":
-                    if not re.match(r'\d{4}-\d{2}-\d{2}', value):
+                    if not QueryExecutor.DATE_PATTERN.match(value):
                         raise ValueError(f"Invalid date format: {value}. Expected YYYY-MM-DD")
                 else:  # datetime
-                    if not re.match(r'\d{4}-\d{2}-\d{2}[T\s]\d{2}:\d{2}:\d{2}', value):
+                    if not QueryExecutor.DATETIME_PATTERN.match(value):
                         raise ValueError(f"Invalid datetime format: {value}. Expected YYYY-MM-DD HH:MM:SS")
                 return value
             else:
@@ -497,3 +555,31 @@ class QueryExecutor:
             # Unknown type: pass through (log warning)
             logger.warning(f"Unknown bind type '{expected_type}' for param '{param_name}', passing through as-is")
             return value
+
+    @staticmethod
+    def _execute_with_call_timeout(
+        cursor, sql: str, binds: Optional[Dict[str, Any]], timeout_seconds: int
+    ) -> None:
+        """Execute on the calling thread, bounded by Connection.call_timeout."""
+        conn = cursor.connection
+        previous_timeout = conn.call_timeout
+        conn.call_timeout = int(timeout_seconds * 1000)
+        try:
+            if binds:
+                cursor.execute(sql, binds)
+            else:
+                cursor.execute(sql)
+        except oracledb.DatabaseError as e:
+            error = e.args[0] if e.args else None
+            if getattr(error, "full_code", None) in QueryExecutor.CALL_TIMEOUT_CODES:
+                logger.error(f"Query timeout exceeded: {timeout_seconds}s")
+                raise TimeoutError(
+                    f"Query execution exceeded timeout of {timeout_seconds} seconds. "
+                    f"Query cancelled by the database."
+                ) from e
+            raise
+        finally:
+            # Pooled connections are shared: don't leak this query's limit
+            conn.call_timeout = previous_timeout
+
+        logger.debug("Query executed successfully within %ss timeout", timeout_seconds)
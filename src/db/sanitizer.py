@@ -7,6 +7,7 @@ Truncates large text fields.
 Caps rows + includes aggregation summary.
 """
 
+import itertools
 import logging
 from typing import List, Dict, Any
 
@@ -34,6 +35,16 @@ class Sanitizer:
         "IP_ADDRESSES": ["ip_address", "host", "ip"],
     }
 
+    # Lowercased once at import; the union lets most columns be rejected
+    # with one set check before the per-category scan
+    _SENSITIVE_PATTERNS_LOWER = {
+        category: tuple(pattern.lower() for pattern in patterns)
+        for category, patterns in SENSITIVE_PATTERNS.items()
+    }
+    _ALL_SENSITIVE_PATTERNS = frozenset(
+        itertools.chain.from_iterable(_SENSITIVE_PATTERNS_LOWER.values())
+    )
+
     MAX_TEXT_LENGTH = 500
     MAX_ROWS = 50
     REDACTION_MARKER = "[REDACTED]"
@@ -55,49 +66,91 @@ class Sanitizer:
             - truncated: Boolean if truncation occurred
             - truncation_markers_count: Count of [REDACTED]/[...truncated] markers
         """
-        sanitized_rows = []
-        redaction_count = 0
-        truncation_count = 0
-
         # Get actual column names from first row (if available)
         actual_columns = set(rows[0].keys()) if rows else set()
+
+        # Copy rows up to the cap (dict() copies in C; values fixed up below)
+        sanitized_rows = [dict(row) for row in rows[: cls.MAX_ROWS]]
+
+        return cls._sanitize_rows(sanitized_rows, len(rows), actual_columns, schema)
+
+    @classmethod
+    def sanitize_result_tuples(
+        cls, col_names: List[str], rows: List[tuple], schema: List[Dict]
+    ) -> Dict[str, Any]:
+        """
+        Sanitize cursor row tuples; same result as sanitize_result().
         
+        Dicts are built only for the rows kept (at most MAX_ROWS), so rows
+        fetched past the cap are never converted.
+        
+        Args:
+            col_names: Column names, in cursor.description order
+            rows: Query result rows as tuples
+            schema: Expected result schema (from control definition)
+        """
+        actual_columns = set(col_names) if rows else set()
+        sanitized_rows = [dict(zip(col_names, row)) for row in rows[: cls.MAX_ROWS]]
+
+        return cls._sanitize_rows(sanitized_rows, len(rows), actual_columns, schema)
+
+    @classmethod
+    def _sanitize_rows(
+        cls,
+        sanitized_rows: List[Dict[str, Any]],
+        row_count: int,
+        actual_columns: set,
+        schema: List[Dict],
+    ) -> Dict[str, Any]:
+        """Redact/truncate freshly built row dicts in place and summarize."""
+        redaction_count = 0
+        truncation_count = 0
+
         # Identify sensitive columns using defense-in-depth
         sensitive_columns = cls._identify_sensitive_columns(schema, actual_columns)
 
-        # Process rows
-        for row_idx, row in enumerate(rows):
-            if row_idx >= cls.MAX_ROWS:
-                break
-
-            sanitized_row = {}
-            for col_name, col_value in row.items():
-                # Check if column is sensitive
-                if col_name in sensitive_columns:
-                    sanitized_row[col_name] = cls.REDACTION_MARKER
-                    redaction_count += 1
-                # Truncate large text
-                elif isinstance(col_value, str) and len(col_value) > cls.MAX_TEXT_LENGTH:
-                    truncated = col_value[: cls.MAX_TEXT_LENGTH] + cls.TRUNCATION_MARKER
-                    sanitized_row[col_name] = truncated
-                    truncation_count += 1
-                else:
-                    sanitized_row[col_name] = col_value
-
-            sanitized_rows.append(sanitized_row)
+        if sanitized_rows and all(row.keys() == actual_columns for row in sanitized_rows):
+            # Cursor results share one column layout: work column by column,
+            # so redaction touches only sensitive columns and the per-cell
+            # string check skips them entirely
+            redacted = [col for col in sanitized_rows[0] if col in sensitive_columns]
+            for col_name in redacted:
+                for row in sanitized_rows:
+                    row[col_name] = cls.REDACTION_MARKER
+            redaction_count = len(redacted) * len(sanitized_rows)
+
+            limit = cls.MAX_TEXT_LENGTH
+            for col_name in actual_columns.difference(redacted):
+                for row in sanitized_rows:
+                    col_value = row[col_name]
+                    # Truncate large text
+                    if isinstance(col_value, str) and len(col_value) > limit:
+                        row[col_name] = col_value[:limit] + cls.TRUNCATION_MARKER
+                        truncation_count += 1
+        else:
+            # Mixed layouts (hand-built rows): check every cell
+            for row in sanitized_rows:
+                for col_name, col_value in row.items():
+                    # Check if column is sensitive
+                    if col_name in sensitive_columns:
+                        row[col_name] = cls.REDACTION_MARKER
+                        redaction_count += 1
+                    # Truncate large text
+                    elif isinstance(col_value, str) and len(col_value) > cls.MAX_TEXT_LENGTH:
+                        row[col_name] = col_value[: cls.MAX_TEXT_LENGTH] + cls.TRUNCATION_MARKER
+                        truncation_count += 1
 
         # Determine if truncation occurred
-        rows_truncated = len(rows) > cls.MAX_ROWS
+        rows_truncated = row_count > cls.MAX_ROWS
 
         logger.debug(
-            f"Sanitization: {len(sanitized_rows)} rows, "
-            f"{redaction_count} redactions, {truncation_count} truncations, "
-            f"rows_truncated={rows_truncated}"
+            "Sanitization: %d rows, %d redactions, %d truncations, rows_truncated=%s",
+            len(sanitized_rows), redaction_count, truncation_count, rows_truncated,
         )
 
         return {
             "rows": sanitized_rows,
-            "row_count": len(rows),
+            "row_count": row_count,
             "truncated": rows_truncated,
             "redaction_count": redaction_count,
             "truncation_count": truncation_count,
@@ -141,15 +194,19 @@ class Sanitizer:
             
             for col_name in actual_columns:
                 col_lower = col_name.lower()
+                col_words = set(col_lower.split('_'))
+                
+                if col_lower not in cls._ALL_SENSITIVE_PATTERNS and col_words.isdisjoint(
+                    cls._ALL_SENSITIVE_PATTERNS
+                ):
+                    continue
                 
                 # Check against all sensitive patterns
-                for pattern_category, pattern_list in cls.SENSITIVE_PATTERNS.items():
+                for pattern_category, pattern_list in cls._SENSITIVE_PATTERNS_LOWER.items():
                     for pattern in pattern_list:
-                        pattern_lower = pattern.lower()
-                        
                         # Exact match or word boundary match to avoid false positives
                         # e.g., "user_name" matches "user_name", not "description" matching "ip"
-                        if col_lower == pattern_lower or pattern_lower in col_lower.split('_'):
+                        if col_lower == pattern or pattern in col_words:
                             pattern_matched.add(col_name)
                             
                             # Warning: pattern matched but not in schema
@@ -164,11 +221,11 @@ class Sanitizer:
             # Merge pattern-matched columns
             sensitive.update(pattern_matched)
 
-        logger.debug(
-            f"Identified {len(sensitive)} sensitive columns: "
-            f"{len(schema_marked)} from schema, "
-            f"{len(sensitive - schema_marked)} from patterns"
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Identified %d sensitive columns: %d from schema, %d from patterns",
+                len(sensitive), len(schema_marked), len(sensitive - schema_marked),
+            )
         
         return sensitive
 
@@ -7,10 +7,11 @@ Uses Naive Bayes with TF-IDF vectorization.
 """
 
 import logging
-from typing import NamedTuple, Optional
+from typing import List, NamedTuple, Optional
 from sklearn.naive_bayes import MultinomialNB
 from sklearn.feature_extraction.text import TfidfVectorizer
 import pickle
+import numpy as np
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -129,6 +130,7 @@ class IntentClassifier:
         # Train classifier
         self.classifier = MultinomialNB(alpha=0.1)
         self.classifier.fit(X_vec, y_train)
+        self._compile_scoring()
 
         logger.info(
             f"✓ IntentClassifier trained: {len(ebs_samples)} EBS + "
@@ -184,6 +186,7 @@ class IntentClassifier:
         # Train classifier
         self.classifier = MultinomialNB(alpha=0.1)
         self.classifier.fit(X_vec, y_train)
+        self._compile_scoring()
 
         logger.info(
             f"✓ IntentClassifier trained from catalog: "
@@ -211,7 +214,83 @@ class IntentClassifier:
         X_vec = self.vectorizer.transform([user_prompt])
 
         # Get probabilities for all classes
-        proba = self.classifier.predict_proba(X_vec)[0]
+        proba = self._predict_proba(X_vec)[0]
+        return self._result_from_proba(proba)
+
+    def classify_batch(self, user_prompts: List[str]) -> List[IntentClassificationResult]:
+        """
+        Classify several prompts with a single vectorize + predict call.
+
+        Sparse TF-IDF transform and scoring are vectorized over rows,
+        so one call for N prompts is much cheaper than N single calls.
+        For offline callers (e.g. test_routing.py); requests classify
+        inline, where a single call already takes under a millisecond.
+
+        Args:
+            user_prompts: List of user input texts
+
+        Returns:
+            IntentClassificationResult per prompt, in input order
+        """
+        if not self.vectorizer or not self.classifier:
+            raise RuntimeError("Classifier not trained")
+
+        if not user_prompts:
+            return []
+
+        X_vec = self.vectorizer.transform(user_prompts)
+        return [self._result_from_proba(proba) for proba in self._predict_proba(X_vec)]
+
+    def _compile_scoring(self):
+        """
+        Cache MultinomialNB parameters for direct scoring.
+
+        predict_proba() spends most of its time on input validation; the
+        model itself is one sparse matmul + softmax:
+            log P(class | x) ∝ x @ feature_log_prob_.T + class_log_prior_
+        """
+        self._log_prob_t = np.ascontiguousarray(self.classifier.feature_log_prob_.T)
+        self._log_prior = self.classifier.class_log_prior_
+        # Tokenizer of the fitted vectorizer (see unknown_terms)
+        self._analyzer = self.vectorizer.build_analyzer()
+
+    def _predict_proba(self, X_vec) -> np.ndarray:
+        """Class probabilities, equivalent to classifier.predict_proba(X_vec)"""
+        jll = X_vec @ self._log_prob_t + self._log_prior
+        jll -= jll.max(axis=1, keepdims=True)  # numerically stable softmax
+        proba = np.exp(jll)
+        proba /= proba.sum(axis=1, keepdims=True)
+        return proba
+
+    def embed(self, user_prompt: str) -> np.ndarray:
+        """
+        Dense TF-IDF vector for a prompt.
+
+        TfidfVectorizer rows are L2-normalized, so the dot product of two
+        embeddings is their cosine similarity. All-zero when no token of
+        the prompt is in the vocabulary.
+        """
+        if not self.vectorizer:
+            raise RuntimeError("Classifier not trained")
+
+        return self.vectorizer.transform([user_prompt]).toarray()[0].astype(np.float32)
+
+    def unknown_terms(self, user_prompt: str) -> frozenset:
+        """
+        Prompt tokens outside the TF-IDF vocabulary.
+
+        embed() ignores them, so prompts that differ only in these words
+        ("invalid objects nedir" / "invalid objects sayısı") get identical
+        embeddings; callers comparing embeddings use this to tell them apart.
+        """
+        if not self.vectorizer:
+            raise RuntimeError("Classifier not trained")
+
+        vocabulary = self.vectorizer.vocabulary_
+        return frozenset(term for term in self._analyzer(user_prompt) if term not in vocabulary)
+
+    def _result_from_proba(self, proba) -> IntentClassificationResult:
+        """Apply routing thresholds to one row of class probabilities"""
         chit_chat_score = proba[self.CHIT_CHAT_CLASS]
         ebs_control_score = proba[self.EBS_CONTROL_CLASS]
 
@@ -236,8 +315,8 @@ class IntentClassifier:
             confidence = max(chit_chat_score, ebs_control_score)
 
         logger.debug(
-            f"Intent classification: intent={intent}, confidence={confidence:.2%}, "
-            f"scores={all_scores}"
+            "Intent classification: intent=%s, confidence=%.2f%%, scores=%s",
+            intent, confidence * 100, all_scores,
         )
 
         return IntentClassificationResult(
@@ -263,5 +342,6 @@ class IntentClassifier:
             model_state = pickle.load(f)
         self.vectorizer = model_state["vectorizer"]
         self.classifier = model_state["classifier"]
+        self._compile_scoring()
         self.classes = model_state["classes"]
         logger.info(f"✓ Classifier loaded from {filepath}")
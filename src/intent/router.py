@@ -14,7 +14,7 @@ Implements explainable scoring with multiple factors:
 import logging
 from typing import List, Optional
 from datetime import datetime
-import uuid
+import os
 
 from src.controls.schema import (
     ControlDefinition,
@@ -85,7 +85,7 @@ class ScoreBasedRouter:
         Returns:
             RouterDecision with candidates, selected control, and justification
         """
-        request_id = f"req_{str(uuid.uuid4())[:8]}"
+        request_id = f"req_{os.urandom(4).hex()}"
         
         logger.info(f"[{request_id}] Routing prompt: intent={intent}")
 
@@ -132,8 +132,8 @@ class ScoreBasedRouter:
         top_candidate = candidates[0]
 
         logger.debug(
-            f"[{request_id}] Top candidate: {top_candidate.control_id} "
-            f"(score={top_candidate.final_score:.3f})"
+            "[%s] Top candidate: %s (score=%.3f)",
+            request_id, top_candidate.control_id, top_candidate.final_score,
         )
 
         # Step 4: Check confidence threshold
@@ -8,8 +8,11 @@ Implements output validation per SECURITY.MD § 3.3.
 
 import json
 import logging
-from typing import Optional
+import time
+from typing import Iterator, Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from src.controls.schema import LLMSummaryResponse
 from src.llm.input_validator import PromptInjectionDetector
 
@@ -19,22 +22,54 @@ logger = logging.getLogger(__name__)
 class OllamaClient:
     """HTTP client for Ollama API."""
 
-    def __init__(self, ollama_url: str, model_name: str, timeout_seconds: int = None):
+    # Rough chars-per-token ratio used to size num_keep (Ollama's HTTP API
+    # exposes no tokenizer endpoint)
+    CHARS_PER_TOKEN = 4
+
+    # Keep-alive connections kept open to Ollama (per worker process);
+    # must cover gunicorn's threads per worker (16) so no call waits for a socket
+    POOL_SIZE = 20
+
+    # Fail fast if Ollama is unreachable; generation itself may be slow
+    # (read timeout stays timeout_seconds)
+    CONNECT_TIMEOUT_SECONDS = 3
+
+    def __init__(self, ollama_url: str, model_name: str, timeout_seconds: int = None,
+                 session: Optional[requests.Session] = None):
         """
         Args:
             ollama_url: Base URL (e.g., http://127.0.0.1:11434)
             model_name: Model name (e.g., ebs-qwen25chat:latest)
             timeout_seconds: Request timeout (None = no timeout, wait indefinitely)
+            session: Shared HTTP session (default: new pooled session)
         """
         self.ollama_url = ollama_url.rstrip("/")
         self.model_name = model_name
         self.timeout_seconds = timeout_seconds
+        self.request_timeout = (self.CONNECT_TIMEOUT_SECONDS, timeout_seconds)
         self.generate_endpoint = f"{self.ollama_url}/api/generate"
+        self.session = session or self._build_session()
+
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        """
+        Pooled keep-alive session so calls reuse TCP connections to Ollama
+        instead of opening a new socket per request.
+
+        Only connection failures are retried: the request never reached
+        Ollama, so retrying cannot trigger a second (expensive) generation.
+        """
+        session = requests.Session()
+        retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=cls.POOL_SIZE, max_retries=retry)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def verify_connectivity(self) -> bool:
         """Verify Ollama is reachable and model loaded."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.ollama_url}/api/tags", timeout=5, json=True
             )
             if response.status_code == 200:
@@ -74,10 +109,10 @@ class OllamaClient:
         full_prompt = f"{system_prompt}\n\nUser: {user_message}"
         
         try:
-            logger.debug(f"Calling Ollama for chat (non-EBS): {self.model_name}")
+            logger.debug("Calling Ollama for chat (non-EBS): %s", self.model_name)
             
             # OPTIMIZATION: Fast params for chat (shorter, faster responses)
-            response = requests.post(
+            response = self.session.post(
                 self.generate_endpoint,
                 json={
                     "model": self.model_name,
@@ -92,7 +127,7 @@ class OllamaClient:
                     },
                     "keep_alive": "30m"
                 },
-                timeout=self.timeout_seconds,
+                timeout=self.request_timeout,
             )
             
             if response.status_code == 200:
@@ -141,33 +176,13 @@ class OllamaClient:
         )
 
         try:
-            logger.debug(f"Calling Ollama: {self.model_name} ({self.timeout_seconds}s timeout)")
+            logger.debug("Calling Ollama: %s (%ss timeout)", self.model_name, self.timeout_seconds)
             logger.info(f"Prompt size: {len(full_prompt)} chars")
 
-            # OPTIMIZATION: Aggressive performance tuning
-            # num_ctx: Minimal context window
-            # num_predict: Increased for detailed responses
-            # repeat_penalty: Avoid repetition (faster generation)
-            # top_k: Limit vocabulary sampling (faster)
-            response = requests.post(
+            response = self.session.post(
                 self.generate_endpoint,
-                json={
-                    "model": self.model_name,
-                    "prompt": full_prompt,
-                    "stream": False,
-                    "temperature": 0.3,  # Low temperature for deterministic summaries
-                    "top_p": 0.9,
-                    "options": {
-                        "num_ctx": 1536,      # Further reduced context (was 2048)
-                        "num_predict": 350,   # Increased for complete responses (was 300)
-                        "num_thread": 8,      # Use 8 CPU threads
-                        "repeat_penalty": 1.2,  # Penalize repetition
-                        "top_k": 40,          # Limit token sampling
-                        "num_batch": 512,     # Batch size for processing
-                    },
-                    "keep_alive": "30m"  # Keep in RAM
-                },
-                timeout=self.timeout_seconds,
+                json=self._build_summarize_payload(full_prompt, system_prompt, stream=False),
+                timeout=self.request_timeout,
             )
 
             if response.status_code == 200:
@@ -188,10 +203,10 @@ class OllamaClient:
 
                 # DEBUG: Log raw Ollama response
                 logger.info(f"Raw Ollama response: {len(raw_response)} chars")
-                logger.debug(f"Response preview: {raw_response[:800]}...")
+                logger.debug("Response preview: %.800s...", raw_response)
 
                 # Parse response into contract
-                parsed = self._parse_response(raw_response)
+                parsed = self.parse_response(raw_response)
                 logger.info(f"✓ Ollama response: {parsed.verdict}")
                 return parsed
 
@@ -208,8 +223,132 @@ class OllamaClient:
             logger.error(f"✗ Ollama call failed: {e}")
             return None
 
+    def stream_summarize(
+        self, system_prompt: str, context: str, user_question: str
+    ) -> Iterator[str]:
+        """
+        Stream summary tokens from Ollama as they are generated.
+
+        Same prompt and options as summarize(), but with stream=True so the
+        caller can forward tokens before generation finishes. Output
+        validation and parsing are left to the caller, which must run them
+        on the accumulated text (see parse_response).
+
+        Args:
+            system_prompt: System policy + behavior constraints
+            context: Control metadata + DB results (sanitized)
+            user_question: Original user prompt (already sanitized)
+
+        Yields:
+            Response text chunks (stops early on error)
+        """
+        from src.llm.prompt_builder import PromptBuilder
+
+        full_prompt = PromptBuilder.build_full_prompt_with_markers(
+            system_prompt, context, user_question
+        )
+
+        try:
+            logger.debug("Streaming from Ollama: %s (%ss timeout)", self.model_name, self.timeout_seconds)
+            logger.info(f"Prompt size: {len(full_prompt)} chars")
+
+            with self.session.post(
+                self.generate_endpoint,
+                json=self._build_summarize_payload(full_prompt, system_prompt, stream=True),
+                timeout=self.request_timeout,
+                stream=True,
+            ) as response:
+                if response.status_code != 200:
+                    logger.error(
+                        f"✗ Ollama returned {response.status_code}: {response.text}"
+                    )
+                    return
+
+                # Ollama streams one JSON object per line until "done": true
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = json.loads(line)
+                    token = chunk.get("response", "")
+                    if token:
+                        yield token
+                    if chunk.get("done"):
+                        break
+
+        except requests.Timeout:
+            logger.error(f"✗ Ollama stream timeout after {self.timeout_seconds}s")
+        except Exception as e:
+            logger.error(f"✗ Ollama stream failed: {e}")
+
+    def warmup(self, system_prompt: str, timeout_seconds: int = 120) -> Optional[float]:
+        """
+        Load the model and prime its KV cache with the system prompt.
+
+        Sends a summarize-shaped request that generates a single token, so
+        the first user request does not pay for model load + system prompt
+        evaluation.
+
+        Args:
+            system_prompt: Same system prompt used for real summaries
+            timeout_seconds: Upper bound for the warm-up call
+
+        Returns:
+            Warm-up duration in ms, or None if it failed
+        """
+        from src.llm.prompt_builder import PromptBuilder
+
+        full_prompt = PromptBuilder.build_full_prompt_with_markers(
+            system_prompt, "warmup", "hi"
+        )
+        payload = self._build_summarize_payload(full_prompt, system_prompt, stream=False)
+        payload["options"]["num_predict"] = 1
+
+        start = time.perf_counter()
+        try:
+            response = self.session.post(
+                self.generate_endpoint, json=payload, timeout=(self.CONNECT_TIMEOUT_SECONDS, timeout_seconds)
+            )
+            if response.status_code != 200:
+                logger.warning(f"Ollama warm-up returned {response.status_code}")
+                return None
+        except Exception as e:
+            logger.warning(f"Ollama warm-up failed: {e}")
+            return None
+
+        return (time.perf_counter() - start) * 1000
+
+    def _build_summarize_payload(self, full_prompt: str, system_prompt: str, stream: bool) -> dict:
+        """
+        Build /api/generate request body for summarization.
+
+        The system prompt is a fixed prefix of every summarize prompt;
+        num_keep + keep_alive let Ollama retain its KV cache between calls.
+        """
+        # OPTIMIZATION: Aggressive performance tuning
+        # num_ctx: Minimal context window
+        # num_predict: Increased for detailed responses
+        # repeat_penalty: Avoid repetition (faster generation)
+        # top_k: Limit vocabulary sampling (faster)
+        return {
+            "model": self.model_name,
+            "prompt": full_prompt,
+            "stream": stream,
+            "temperature": 0.3,  # Low temperature for deterministic summaries
+            "top_p": 0.9,
+            "options": {
+                "num_ctx": 1536,      # Further reduced context (was 2048)
+                "num_predict": 350,   # Increased for complete responses (was 300)
+                "num_thread": 8,      # Use 8 CPU threads
+                "repeat_penalty": 1.2,  # Penalize repetition
+                "top_k": 40,          # Limit token sampling
+                "num_batch": 512,     # Batch size for processing
+                "num_keep": len(system_prompt) // self.CHARS_PER_TOKEN,  # Keep system prefix on context shift
+            },
+            "keep_alive": "30m"  # Keep in RAM
+        }
+
     @staticmethod
-    def _parse_response(raw_response: str) -> LLMSummaryResponse:
+    def parse_response(raw_response: str) -> LLMSummaryResponse:
         """
         Parse raw Ollama response into LLMSummaryResponse contract.
 
@@ -322,7 +461,7 @@ class OllamaClient:
                     verdict = "CRIT"
                     break
 
-        logger.debug(f"Parsed response: verdict={verdict}, bullets={len(summary_bullets)}, evidence={len(evidence)}")
+        logger.debug("Parsed response: verdict=%s, bullets=%d, evidence=%d", verdict, len(summary_bullets), len(evidence))
 
         return LLMSummaryResponse(
             summary_bullets=summary_bullets,
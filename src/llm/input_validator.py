@@ -9,6 +9,7 @@ Validates user input for:
 - Malicious prompt patterns
 """
 
+import functools
 import re
 import logging
 from typing import Tuple, Optional
@@ -21,6 +22,35 @@ class InputValidationError(Exception):
     pass
 
 
+def _compile_injection_pattern(pattern: str) -> Tuple["re.Pattern", ...]:
+    """
+    Compile an injection pattern, keeping "A.*?B" patterns linear.
+    
+    Searched as-is, "A.*?B" rescans to the end of the input from every
+    occurrence of A when B is absent (quadratic: ~15ms for 2000 chars of
+    "ignore all ..."). A later A can only be followed by a B that the
+    first A also precedes, so "A.*?B" is compiled as the parts (A, B):
+    find the first A, then search B from its end (see _search_in_order).
+    Scanned input has no newlines, so the gap needs no DOTALL handling.
+    """
+    head, gap, tail = pattern.partition(".*?")
+    parts = (head, tail) if gap else (pattern,)
+    # Scanned against UTF-8 bytes (see _sanitize_and_scan): all patterns
+    # are ASCII, and bytes matching skips the wide-char path of str
+    return tuple(re.compile(part.encode(), re.IGNORECASE) for part in parts)
+
+
+def _search_in_order(parts: Tuple["re.Pattern", ...], data: bytes) -> bool:
+    """True if every part matches, each after the previous part's match."""
+    pos = 0
+    for part in parts:
+        match = part.search(data, pos)
+        if match is None:
+            return False
+        pos = match.end()
+    return True
+
+
 class PromptInjectionDetector:
     """
     Detect and prevent prompt injection attacks.
@@ -71,8 +101,48 @@ class PromptInjectionDetector:
         r"exec\s*\(",
     ]
     
+    # Context separation markers (one format call, see add_context_markers)
+    CONTEXT_MARKERS_TEMPLATE = (
+        "--- START DB RESULTS ---\n"
+        "{db_results}\n"
+        "--- END DB RESULTS ---\n"
+        "\n"
+        "--- USER QUESTION ---\n"
+        "{user_prompt}\n"
+        "--- END USER QUESTION ---"
+    )
+    
     # Control characters to strip (except common whitespace)
     CONTROL_CHARS = r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]'
+
+    # Compiled once at import. Kept as separate patterns rather than one
+    # alternation: re only applies its literal-prefix scan to a single
+    # pattern, so 25 separate searches beat one 25-way alternation (~3x).
+    _CONTROL_CHARS_RE = re.compile(CONTROL_CHARS)
+    _INJECTION_RES = tuple(
+        zip(INJECTION_PATTERNS, map(_compile_injection_pattern, INJECTION_PATTERNS))
+    )
+    # Unicode IGNORECASE matches these non-ASCII letters against ASCII
+    # pattern letters (e.g. Turkish "İGNORE"); bytes patterns do not, so
+    # they are folded to ASCII before encoding
+    _ASCII_CASE_FOLD = str.maketrans({"\u0130": "I", "\u0131": "i", "\u017f": "s", "\u212a": "K"})
+    # System prompt leakage markers checked in LLM output
+    _LEAKAGE_RES = tuple(
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r"You are an Oracle EBS",  # Our system prompt
+            r"SYSTEM_PROMPT",
+            r"<\|system\|>",
+            r"###\s+System:",
+        )
+    )
+    # Streamed output is forwarded only up to this many chars before the
+    # end of the text received so far (more than the longest leakage
+    # marker), so a marker split across chunks is caught before any part
+    # of it reaches the client. A trailing "###" + whitespace can grow
+    # past that, so it is held back as well.
+    OUTPUT_HOLDBACK_CHARS = 64
+    _OPEN_MARKER_RE = re.compile(r"###\s*[A-Za-z:]{0,7}\Z")
     
     @classmethod
     def validate_and_sanitize(cls, user_input: str, request_id: str = "unknown") -> Tuple[str, bool, Optional[str]]:
@@ -106,28 +176,19 @@ class PromptInjectionDetector:
                 f"(max: {cls.MAX_LENGTH})"
             )
         
-        # Step 2: Strip control characters
-        sanitized = re.sub(cls.CONTROL_CHARS, '', user_input)
-        
-        # Step 3: Normalize whitespace (collapse multiple spaces/newlines)
-        sanitized = re.sub(r'\s+', ' ', sanitized).strip()
+        # Steps 2-4: Sanitize + pattern scan (memoized per distinct input)
+        sanitized, pattern = cls._sanitize_and_scan(user_input)
         
         if not sanitized:
             raise InputValidationError("Input contains only control characters")
         
-        # Step 4: Check for injection patterns
-        is_suspicious = False
-        matched_pattern = None
-        
-        for pattern in cls.INJECTION_PATTERNS:
-            if re.search(pattern, sanitized, re.IGNORECASE):
-                is_suspicious = True
-                matched_pattern = pattern
-                logger.warning(
-                    f"[{request_id}] INJECTION ATTEMPT DETECTED: "
-                    f"pattern='{pattern}', input='{sanitized[:100]}'"
-                )
-                break
+        is_suspicious = pattern is not None
+        if is_suspicious:
+            # Logged on every attempt, cache hit or not
+            logger.warning(
+                f"[{request_id}] INJECTION ATTEMPT DETECTED: "
+                f"pattern='{pattern}', input='{sanitized[:100]}'"
+            )
         
         # Step 5: Generate warning message
         warning_message = None
@@ -139,6 +200,35 @@ class PromptInjectionDetector:
         
         return sanitized, is_suspicious, warning_message
     
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _sanitize_and_scan(user_input: str) -> Tuple[str, Optional[str]]:
+        """
+        Strip control chars, collapse whitespace, and find the first
+        injection pattern. Pure function of the input, so repeated prompts
+        are served from the cache; inputs are <= MAX_LENGTH chars, which
+        bounds the cache at a few MB.
+        
+        Returns:
+            (sanitized_input, matched_pattern or None)
+        """
+        detector = PromptInjectionDetector
+        
+        # Step 2: Strip control characters
+        sanitized = detector._CONTROL_CHARS_RE.sub('', user_input)
+        
+        # Step 3: Normalize whitespace (collapse multiple spaces/newlines).
+        # str.split() splits on the same characters as \s and also strips
+        sanitized = ' '.join(sanitized.split())
+        
+        # Step 4: Check for injection patterns
+        scanned = sanitized.translate(detector._ASCII_CASE_FOLD).encode()
+        for pattern, parts in detector._INJECTION_RES:
+            if _search_in_order(parts, scanned):
+                return sanitized, pattern
+        
+        return sanitized, None
+    
     @classmethod
     def add_context_markers(cls, db_results: str, user_prompt: str) -> str:
         """
@@ -154,20 +244,7 @@ class PromptInjectionDetector:
         Returns:
             Marked context string
         """
-        marked = []
-        
-        # DB Results section
-        marked.append("--- START DB RESULTS ---")
-        marked.append(db_results)
-        marked.append("--- END DB RESULTS ---")
-        marked.append("")
-        
-        # User Question section
-        marked.append("--- USER QUESTION ---")
-        marked.append(user_prompt)
-        marked.append("--- END USER QUESTION ---")
-        
-        return "\n".join(marked)
+        return cls.CONTEXT_MARKERS_TEMPLATE.format(db_results=db_results, user_prompt=user_prompt)
     
     @classmethod
     def validate_output(cls, llm_response: str, request_id: str = "unknown") -> bool:
@@ -185,20 +262,13 @@ class PromptInjectionDetector:
             True if response is safe, False if suspicious
         """
         # Check for system prompt leakage
-        leakage_patterns = [
-            r"You are an Oracle EBS",  # Our system prompt
-            r"SYSTEM_PROMPT",
-            r"<\|system\|>",
-            r"###\s+System:",
-        ]
-        
-        for pattern in leakage_patterns:
-            if re.search(pattern, llm_response, re.IGNORECASE):
-                logger.error(
-                    f"[{request_id}] SYSTEM PROMPT LEAKAGE DETECTED: "
-                    f"pattern='{pattern}' in response"
-                )
-                return False
+        leaked = cls.find_output_leakage(llm_response)
+        if leaked:
+            logger.error(
+                f"[{request_id}] SYSTEM PROMPT LEAKAGE DETECTED: "
+                f"pattern='{leaked}' in response"
+            )
+            return False
         
         # Check for abnormally long responses (potential context stuffing)
         MAX_RESPONSE_LENGTH = 10000  # 10KB
@@ -209,3 +279,26 @@ class PromptInjectionDetector:
             # Don't reject, just warn (LLM might be verbose)
         
         return True
+    
+    @classmethod
+    def find_output_leakage(cls, llm_response: str) -> Optional[str]:
+        """Return the first system prompt leakage pattern found, or None."""
+        for compiled in cls._LEAKAGE_RES:
+            if compiled.search(llm_response):
+                return compiled.pattern
+        return None
+    
+    @classmethod
+    def releasable_output_length(cls, partial_response: str) -> int:
+        """
+        How many leading chars of a partial (streamed) LLM response can be
+        forwarded, assuming find_output_leakage() found nothing in it.
+        
+        Per SECURITY.MD § 3.3: no part of a leakage marker may reach the
+        client, so the tail that could still become one is held back.
+        """
+        end = len(partial_response) - cls.OUTPUT_HOLDBACK_CHARS
+        open_marker = cls._OPEN_MARKER_RE.search(partial_response)
+        if open_marker:
+            end = min(end, open_marker.start())
+        return max(end, 0)
@@ -6,8 +6,11 @@ Constructs system + context + user prompts from control metadata + DB results.
 Implements context separation markers per SECURITY.MD § 3.2.
 """
 
+import functools
+import itertools
 import logging
-from typing import List, Dict, Any
+import os
+from typing import List, Dict, Any, Optional
 from src.controls.schema import ControlDefinition, ControlExecutionResult
 
 logger = logging.getLogger(__name__)
@@ -16,6 +19,19 @@ logger = logging.getLogger(__name__)
 class PromptBuilder:
     """Build system and context prompts for Ollama."""
 
+    # Context separation markers (SECURITY.MD § 3.2)
+    FULL_PROMPT_TEMPLATE = (
+        "{system_prompt}\n"
+        "\n"
+        "--- START DB RESULTS ---\n"
+        "{context}\n"
+        "--- END DB RESULTS ---\n"
+        "\n"
+        "--- USER QUESTION ---\n"
+        "{user_question}\n"
+        "--- END USER QUESTION ---"
+    )
+
     # System prompt (policy + behavior constraints) - OPTIMIZED FOR SPEED
     SYSTEM_PROMPT = """Oracle EBS R12.2 ops assistant. Analyze DB results.
 
@@ -46,6 +62,38 @@ OUTPUT STRUCTURE:
 - Action 3: troubleshooting step
 """
 
+    # knowledge/controls/ (knowledge files live next to control JSON)
+    KNOWLEDGE_DIR = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+        "knowledge", "controls"
+    )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def load_knowledge(knowledge_file: str) -> Optional[str]:
+        """
+        Read a control's domain knowledge file.
+
+        Knowledge files are static for the life of the process, so each is
+        read from disk once and then served from memory. Call at startup to
+        move the disk read out of the first request.
+
+        Returns:
+            File content, or None if missing/unreadable
+        """
+        knowledge_path = os.path.join(PromptBuilder.KNOWLEDGE_DIR, knowledge_file)
+        try:
+            if not os.path.exists(knowledge_path):
+                logger.warning(f"Knowledge file not found: {knowledge_path}")
+                return None
+            with open(knowledge_path, 'r', encoding='utf-8') as f:
+                knowledge_content = f.read()
+            logger.info(f"Loaded knowledge file: {knowledge_file} ({len(knowledge_content)} chars)")
+            return knowledge_content
+        except Exception as e:
+            logger.error(f"Failed to load knowledge file {knowledge_file}: {e}")
+            return None
+
     @staticmethod
     def build_system_prompt() -> str:
         """Return the system prompt (policy + behavior constraints)."""
@@ -72,25 +120,13 @@ OUTPUT STRUCTURE:
         lines.append(f"**Task**: {control.doc_hint}")
         lines.append("")
         
-        # Load domain knowledge if specified
+        # Load domain knowledge if specified (cached after first read)
         if control.knowledge_file:
-            try:
-                import os
-                knowledge_path = os.path.join(
-                    os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
-                    "knowledge", "controls", control.knowledge_file
-                )
-                if os.path.exists(knowledge_path):
-                    with open(knowledge_path, 'r', encoding='utf-8') as f:
-                        knowledge_content = f.read()
-                    lines.append("**Domain Knowledge:**")
-                    lines.append(knowledge_content)
-                    lines.append("")
-                    logger.info(f"Loaded knowledge file: {control.knowledge_file} ({len(knowledge_content)} chars)")
-                else:
-                    logger.warning(f"Knowledge file not found: {knowledge_path}")
-            except Exception as e:
-                logger.error(f"Failed to load knowledge file {control.knowledge_file}: {e}")
+            knowledge_content = PromptBuilder.load_knowledge(control.knowledge_file)
+            if knowledge_content is not None:
+                lines.append("**Domain Knowledge:**")
+                lines.append(knowledge_content)
+                lines.append("")
         
         # Query results (compact format)
         lines.append("**Data:**")
@@ -110,24 +146,21 @@ OUTPUT STRUCTURE:
                     lines.append(f"**Total rows**: {row_count}")
                     
                     # Show first 5 as compact sample (NO TRUNCATION for object names)
-                    columns = list(query_result.rows[0].keys())
-                    lines.append(f"**Columns**: {', '.join(columns)}")
-                    lines.append(f"**Sample (first 5)**:")
-                    
-                    for i, row in enumerate(query_result.rows[:5], 1):
-                        # Show full values (no truncation for clarity)
-                        values = [f"{k}={str(v)}" for k, v in row.items()]
-                        lines.append(f"  {i}. {'; '.join(values)}")
+                    lines.append(f"**Columns**: {', '.join(query_result.rows[0])}")
+                    lines.append("**Sample (first 5)**:")
+                    lines.extend(
+                        f"  {i}. " + "; ".join(f"{k}={v}" for k, v in row.items())
+                        for i, row in enumerate(itertools.islice(query_result.rows, 5), 1)
+                    )
                     
                     lines.append(f"_(+{row_count - 5} more rows)_")
                 else:
                     # Small dataset: show all compactly
-                    columns = list(query_result.rows[0].keys())
                     lines.append(f"**Rows**: {row_count}")
-                    
-                    for i, row in enumerate(query_result.rows, 1):
-                        values = [f"{k}={str(v)[:25]}" for k, v in row.items()]
-                        lines.append(f"  {i}. {'; '.join(values)}")
+                    lines.extend(
+                        f"  {i}. " + "; ".join(f"{k}={str(v)[:25]}" for k, v in row.items())
+                        for i, row in enumerate(query_result.rows, 1)
+                    )
 
             lines.append("")
 
@@ -174,16 +207,7 @@ OUTPUT STRUCTURE:
         Returns:
             Full prompt with separation markers
         """
-        parts = []
-        
-        parts.append(system_prompt)
-        parts.append("")
-        parts.append("--- START DB RESULTS ---")
-        parts.append(context)
-        parts.append("--- END DB RESULTS ---")
-        parts.append("")
-        parts.append("--- USER QUESTION ---")
-        parts.append(user_question)
-        parts.append("--- END USER QUESTION ---")
-        
-        return "\n".join(parts)
+        # One format call: the (possibly large) context is copied once
+        return PromptBuilder.FULL_PROMPT_TEMPLATE.format(
+            system_prompt=system_prompt, context=context, user_question=user_question
+        )
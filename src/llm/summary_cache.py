@@ -0,0 +1,98 @@
+"""
+Summary Cache for Ollama results.
+Per AGENTS.md § 7 (Ollama Prompting Rules).
+
+Identical DB results + identical question => identical summary.
+Caches LLMSummaryResponse objects keyed by a fingerprint of the
+sanitized execution result, so repeated checks skip the Ollama call.
+"""
+
+import hashlib
+import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.controls.schema import ControlExecutionResult, LLMSummaryResponse
+
+logger = logging.getLogger(__name__)
+
+
+def fingerprint_result(exec_result: ControlExecutionResult) -> str:
+    """
+    Stable fingerprint of a control execution result.
+
+    Rows are fed to the hash one value at a time instead of serializing the
+    whole result to JSON first, so no intermediate string of the full
+    result set is built. Not cryptographic: the key is internal only.
+
+    Args:
+        exec_result: Sanitized ControlExecutionResult
+
+    Returns:
+        16-char hex digest
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(exec_result.control_id.encode())
+    h.update(exec_result.control_version.encode())
+
+    for qr in exec_result.query_results:
+        h.update(qr.query_id.encode())
+        h.update(struct.pack("<Q", qr.row_count))
+        if qr.error:
+            h.update(qr.error.encode())
+        for row in qr.rows:
+            h.update(struct.pack("<Q", len(row)))
+            for value in row.values():
+                h.update(repr(value).encode())
+                h.update(b"\x1f")  # value separator
+
+    return h.hexdigest()
+
+
+class SummaryCache:
+    """
+    Thread-safe LRU + TTL cache of LLM summaries.
+
+    Key: (result fingerprint, user prompt). The prompt is part of the key
+    because it drives the summary language and focus.
+    """
+
+    MAX_ENTRIES = 256
+    TTL_SECONDS = 300
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl_seconds: int = TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(exec_result: ControlExecutionResult, user_prompt: str) -> tuple:
+        """Build cache key for an execution result + question."""
+        return (fingerprint_result(exec_result), user_prompt)
+
+    def get(self, key: tuple) -> Optional[LLMSummaryResponse]:
+        """Return cached summary, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            summary, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return summary
+
+    def put(self, key: tuple, summary: LLMSummaryResponse) -> None:
+        """Store summary, evicting least recently used entries over capacity."""
+        with self._lock:
+            self._entries[key] = (summary, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -21,6 +21,13 @@ class LogSanitizer:
     
     # Control characters to remove (except space and tab)
     CONTROL_CHARS = r'[\x00-\x08\x0B\x0C\x0E-\x1F\x7F]'
+
+    _CONTROL_CHARS_RE = re.compile(CONTROL_CHARS)
+    
+    # sanitize_list() cleans all items in one pass, joined on a record
+    # separator that this pattern (CONTROL_CHARS minus \x1e) keeps
+    _LIST_SEPARATOR = '\x1e'
+    _LIST_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0B\x0C\x0E-\x1D\x1F\x7F]')
     
     # Max length for logged user input (prevent log flooding)
     MAX_LOG_LENGTH = 200
@@ -42,18 +49,28 @@ class LogSanitizer:
         
         # Convert to string
         s = str(value)
+        max_len = max_length or cls.MAX_LOG_LENGTH
         
-        # Step 1: Remove control characters
-        s = re.sub(cls.CONTROL_CHARS, '', s)
+        # Large values (row dumps, tracebacks) are cut before cleaning:
+        # cleaning is per character, so if the first max_len + 1 chars
+        # already overflow max_len, the rest would be truncated away anyway
+        head = s[:max_len + 1]
         
-        # Step 2: Replace newlines with literal \n
-        s = s.replace('\n', '\\n').replace('\r', '\\r')
+        # Fast path for the common clean value: control chars, \t, \n and
+        # \r are all non-printable, so a printable head needs no cleaning
+        if head.isprintable():
+            return s if len(s) <= max_len else s[:max_len] + '...'
+        
+        if len(s) > max_len:
+            head = cls._clean(head, cls._CONTROL_CHARS_RE)
+            if len(head) > max_len:
+                return head[:max_len] + '...'
         
-        # Step 3: Replace tabs with literal \t
-        s = s.replace('\t', '\\t')
+        # Steps 1-3: Remove control characters, replace newlines and tabs
+        # with literal \n, \r, \t
+        s = cls._clean(s, cls._CONTROL_CHARS_RE)
         
         # Step 4: Truncate if too long
-        max_len = max_length or cls.MAX_LOG_LENGTH
         if len(s) > max_len:
             s = s[:max_len] + '...'
         
@@ -88,7 +105,29 @@ class LogSanitizer:
         Returns:
             New list with sanitized items
         """
-        return [cls.sanitize(item, max_length) for item in lst]
+        items = ["None" if item is None else str(item) for item in lst]
+        if not items:
+            return []
+        
+        sep = cls._LIST_SEPARATOR
+        joined = sep.join(items)
+        if joined.count(sep) != len(items) - 1:
+            # An item contains the separator itself: sanitize one by one
+            return [cls.sanitize(item, max_length) for item in lst]
+        
+        max_len = max_length or cls.MAX_LOG_LENGTH
+        cleaned = cls._clean(joined, cls._LIST_CONTROL_CHARS_RE).split(sep)
+        return [
+            "None" if item is None  # as in sanitize(): never truncated
+            else s if len(s) <= max_len else s[:max_len] + '...'
+            for item, s in zip(lst, cleaned)
+        ]
+    
+    @staticmethod
+    def _clean(s: str, control_chars: "re.Pattern") -> str:
+        """Drop control characters, then escape newline / CR / tab."""
+        s = control_chars.sub('', s)
+        return s.replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
 
 
 def safe_log_value(value: Any, max_length: int = None) -> str:
@@ -13,6 +13,11 @@ from flask import Flask
 def setup_logging(app: Flask):
     """Setup structured JSON logging"""
     
+    # Skip per-record thread/process lookups (not part of our log schema)
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Console handler with JSON format
     console_handler = logging.StreamHandler()
     json_formatter = jsonlogger.JsonFormatter()
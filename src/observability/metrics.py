@@ -0,0 +1,107 @@
+"""
+In-memory latency metrics for /api/metrics.
+Per AGENTS.md § 8.2 (Metrics).
+
+Per-request stage timings are written into a fixed-size numpy ring
+buffer, so recording is one row store and aggregation (percentiles,
+means) is vectorized over the whole window. Nothing is written to disk.
+
+Records are (intent_code, intent_ms, db_ms, ollama_ms, total_ms).
+Request and error totals are lifetime counters (itertools.count, whose
+next() is atomic under the GIL); latency aggregates cover the window.
+Writes are not locked: a concurrent reader may see one half-written row,
+which is acceptable for dashboard aggregates.
+"""
+
+import itertools
+from typing import Any, Dict
+
+import numpy as np
+
+# Intent name -> code stored in column 0
+INTENT_CODES = {"chit_chat": 0, "ebs_control": 1, "ambiguous": 2, "unknown": 3}
+
+_COL_INTENT, _COL_INTENT_MS, _COL_DB_MS, _COL_OLLAMA_MS, _COL_TOTAL_MS = range(5)
+
+
+class LatencyRecorder:
+    """Fixed-capacity ring buffer of per-request stage latencies."""
+
+    CAPACITY = 8192  # power of two: slot = counter & (CAPACITY - 1)
+
+    def __init__(self, capacity: int = CAPACITY):
+        if capacity & (capacity - 1):
+            raise ValueError(f"capacity must be a power of two, got {capacity}")
+        self._mask = capacity - 1
+        self._buffer = np.zeros((capacity, 5), dtype=np.float32)
+        self._counter = itertools.count()  # next() is atomic under the GIL
+        self._errors = itertools.count()
+        self._recorded = 0
+        self._error_count = 0
+        # Lifetime per-intent counts, indexed by intent code
+        self._intent_counters = [itertools.count() for _ in INTENT_CODES]
+        self._intent_totals = [0] * len(INTENT_CODES)
+
+    def record(
+        self,
+        intent: str,
+        intent_ms: float = 0.0,
+        db_ms: float = 0.0,
+        ollama_ms: float = 0.0,
+        total_ms: float = 0.0,
+    ) -> None:
+        """Store one request's stage timings."""
+        code = INTENT_CODES.get(intent, INTENT_CODES["unknown"])
+        n = next(self._counter)
+        self._buffer[n & self._mask] = (
+            code,
+            intent_ms,
+            db_ms,
+            ollama_ms,
+            total_ms,
+        )
+        self._recorded = n + 1
+        self._intent_totals[code] = next(self._intent_counters[code]) + 1
+
+    def record_error(self) -> None:
+        """Count one failed request."""
+        self._error_count = next(self._errors) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Aggregate the current window for /api/metrics."""
+        total = self._recorded
+        window = self._buffer[: min(total, self._mask + 1)]
+
+        result: Dict[str, Any] = {
+            "requests_total": total,
+            "ebs_control_requests": self._intent_totals[INTENT_CODES["ebs_control"]],
+            "requests_by_intent": {
+                intent: self._intent_totals[code] for intent, code in INTENT_CODES.items()
+            },
+            "avg_response_time_ms": 0,
+            "errors": self._error_count,
+            "window_size": len(window),
+        }
+        if not len(window):
+            return result
+
+        total_ms = window[:, _COL_TOTAL_MS]
+        ebs = window[window[:, _COL_INTENT] == INTENT_CODES["ebs_control"]]
+
+        p50, p95, p99 = np.percentile(total_ms, [50, 95, 99])
+        result.update({
+            "avg_response_time_ms": round(float(total_ms.mean()), 1),
+            "p50_response_time_ms": round(float(p50), 1),
+            "p95_response_time_ms": round(float(p95), 1),
+            "p99_response_time_ms": round(float(p99), 1),
+            "avg_intent_time_ms": round(float(window[:, _COL_INTENT_MS].mean()), 1),
+        })
+        if len(ebs):
+            result["avg_db_time_ms"] = round(float(ebs[:, _COL_DB_MS].mean()), 1)
+            result["avg_ollama_time_ms"] = round(float(ebs[:, _COL_OLLAMA_MS].mean()), 1)
+
+        return result
+
+
+# Process-wide recorder (one per gunicorn worker)
+latency_metrics = LatencyRecorder()
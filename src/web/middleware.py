@@ -10,7 +10,7 @@ from flask_limiter.util import get_remote_address
 from functools import wraps
 import logging
 import time
-import uuid
+import os
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -27,19 +27,35 @@ def setup_rate_limiter(app: Flask) -> Limiter:
     - 10 requests per minute (per IP)
     - 100 requests per hour (per IP)
     
+    Storage comes from RATELIMIT_STORAGE_URI (default memory://, which is
+    per gunicorn worker). Set a redis:// URI to share counters across
+    workers (needs the redis client from requirements.txt); fixed-window
+    then costs one pipelined INCR + EXPIRE per limit, while moving-window
+    runs a Lua script (EVALSHA) per request.
+    
+    Idempotent per app: a second call returns the limiter already
+    attached instead of registering another set of request hooks.
+    
     Returns:
         Limiter instance
     """
     global limiter
     
+    if "rate_limiter" in app.extensions:
+        limiter = app.extensions["rate_limiter"]
+        return limiter
+    
     limiter = Limiter(
         app=app,
         key_func=get_remote_address,  # Rate limit by IP address
         default_limits=["100 per hour", "10 per minute"],
-        storage_uri="memory://",  # In-memory storage (simple, fast)
+        storage_uri=os.getenv("RATELIMIT_STORAGE_URI", "memory://"),
         strategy="fixed-window",
+        key_prefix="ebs-insight",  # Namespace keys in shared storage
     )
     
+    app.extensions["rate_limiter"] = limiter
+    
     logger.info("✓ Rate limiter initialized: 10/min, 100/hour per IP")
     return limiter
 
@@ -50,7 +66,7 @@ def setup_middleware(app: Flask):
     @app.before_request
     def before_request():
         """Track request timing and assign request ID"""
-        g.request_id = str(uuid.uuid4())[:8]
+        g.request_id = os.urandom(4).hex()
         g.start_time = time.time()
         
         # Log request
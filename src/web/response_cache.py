@@ -0,0 +1,139 @@
+"""
+Response Caches for /api/chat.
+Per AGENTS.md § 3.1 (Web layer).
+
+Two tiers, both checked before the ML pipeline:
+- ExactResponseCache: SHA-256 of the normalized prompt, O(1) dict lookup
+- SemanticResponseCache: cosine similarity of prompt embeddings
+
+Equivalent chat questions should not each pay for an Ollama call.
+Responses are cached against the prompt's L2-normalized embedding; a new
+prompt hits when its cosine similarity to a cached one is >= threshold
+and its tag (the caller's extra discriminator) is equal.
+
+All cached embeddings live in one numpy matrix, so a lookup is a single
+matrix-vector product over every entry.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+import numpy as np
+
+
+class ExactResponseCache:
+    """
+    Thread-safe LRU + TTL cache of chat payloads keyed by exact prompt.
+
+    Prompts are normalized (strip + lowercase) before hashing, so trivial
+    case/whitespace differences still hit.
+    """
+
+    MAX_ENTRIES = 1024
+    TTL_SECONDS = 300  # DB state changes; keep short like SummaryCache
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl_seconds: int = TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(user_prompt: str) -> str:
+        """SHA-256 of the normalized prompt."""
+        return hashlib.sha256(user_prompt.strip().lower().encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return cached payload, or None if missing/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            payload, stored_at = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: str, payload: Dict[str, Any]) -> None:
+        """Store payload, evicting least recently used entries over capacity."""
+        with self._lock:
+            self._entries[key] = (payload, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SemanticResponseCache:
+    """
+    Thread-safe similarity cache of chat response payloads.
+
+    The caller decides what is stored. Entries expire after TTL_SECONDS;
+    when full, the least recently used entry is overwritten.
+
+    Embeddings only see the vocabulary they were fitted on, so prompts
+    that differ in other words can be identical vectors. Entries carry a
+    tag (e.g. the prompt's out-of-vocabulary terms) that must also match.
+
+    Vectors stay float32: TF-IDF embeddings are vocabulary-sized (~70
+    dims), so the full matrix is ~150KB, and NumPy integer matmuls bypass
+    BLAS (int8 scoring measured 3-8x slower than float32 here).
+    """
+
+    MAX_ENTRIES = 512
+    TTL_SECONDS = 300  # DB state changes; keep short like SummaryCache
+    SIMILARITY_THRESHOLD = 0.92
+
+    def __init__(
+        self,
+        dim: int,
+        max_entries: int = MAX_ENTRIES,
+        ttl_seconds: int = TTL_SECONDS,
+        threshold: float = SIMILARITY_THRESHOLD,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.threshold = threshold
+        self._matrix = np.zeros((max_entries, dim), dtype=np.float32)
+        self._stored_at = np.full(max_entries, -np.inf)
+        self._last_used = np.full(max_entries, -np.inf)
+        self._payloads: list = [None] * max_entries
+        self._tags: list = [None] * max_entries
+        self._lock = threading.Lock()
+
+    def lookup(self, query_vec: np.ndarray, tag: Hashable = None) -> Optional[Dict[str, Any]]:
+        """Return the most similar live payload above threshold, or None."""
+        if not query_vec.any():
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            sims = self._matrix @ query_vec
+            sims[now - self._stored_at > self.ttl_seconds] = -1.0  # expired/empty
+            best = int(sims.argmax())
+            if sims[best] < self.threshold or self._tags[best] != tag:
+                return None
+
+            self._last_used[best] = now
+            return self._payloads[best]
+
+    def put(self, query_vec: np.ndarray, payload: Dict[str, Any], tag: Hashable = None) -> None:
+        """Store payload, replacing an expired or the least recently used slot."""
+        if not query_vec.any():
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            expired = now - self._stored_at > self.ttl_seconds
+            slot = int(expired.argmax()) if expired.any() else int(self._last_used.argmin())
+            self._matrix[slot] = query_vec
+            self._stored_at[slot] = now
+            self._last_used[slot] = now
+            self._payloads[slot] = payload
+            self._tags[slot] = tag
@@ -3,435 +3,987 @@ Web layer routes - API endpoints for chat, intent classification, etc.
 Per AGENTS.md § 3.1 (Web layer).
 """
 
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify, current_app, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 import logging
-import uuid
+import functools
+import hashlib
+import os
 import json
+import time
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Generator, Iterator, Optional, Tuple
 
 from src.llm.input_validator import PromptInjectionDetector, InputValidationError
 from src.observability.log_sanitizer import safe_log_value
+from src.observability.metrics import latency_metrics
 
 logger = logging.getLogger(__name__)
 
+# Router confidence below this is treated as chit-chat (10% normalized score)
+CHIT_CHAT_SCORE_THRESHOLD = 0.10
+
+# Chat bodies are tiny ({"prompt": ..., "session_id": ...}); prompt itself is
+# capped at PromptInjectionDetector.MAX_LENGTH chars, so 32KB is generous
+MAX_CHAT_BODY_BYTES = 32 * 1024
+
+# /api/controls is static after startup; let browsers/proxies reuse it briefly
+CONTROLS_MAX_AGE_SECONDS = 60
+
+# Canned chit-chat replies, checked in order (first matching keyword wins)
+_CHIT_CHAT_REPLIES = (
+    (("merhaba", "hello"), "Merhaba! Ben EBS sistem yöneticisine yardımcı olmak için tasarlanmış bir yapay zekâyım. EBS sisteminde herhangi bir sorunuz var mı?"),
+    (("nasılsın", "how are you"), "İyiyim, teşekkür ederim! EBS sistemine dair sorularınızı yanıtlamak için buradayım."),
+    (("teşekkür", "thank"), "Rica ederim! Başka bir şey ile yardımcı olabilir miyim?"),
+)
+_CHIT_CHAT_DEFAULT_REPLY = (
+    "Bana EBS sistemi hakkında sorularınızı sorun. Concurrent Manager, Invalid Objects, "
+    "ADOP durumu veya Workflow hakkında bilgi almak isteyebilirsiniz."
+)
+
+# Verdict -> (emoji, Turkish label) for formatted responses
+_VERDICT_DISPLAY = {
+    "OK": ("✓", "Normal"),
+    "WARN": ("⚠️", "Dikkat Gerekli"),
+    "CRIT": ("🔴", "Kritik Durum"),
+    "UNKNOWN": ("❓", "Bilinmeyen"),
+}
+
+
+# Compact encoder for /api/chat bodies, built once instead of per jsonify()
+# call; same default hook as app.json (dates, Decimal, dataclasses)
+_CHAT_JSON_ENCODER = json.JSONEncoder(
+    ensure_ascii=True, separators=(",", ":"), default=DefaultJSONProvider.default
+)
+
+# SSE frames carry the same payloads (raw_data rows hold DATE columns as
+# datetimes), so they need the same default hook
+_SSE_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, default=DefaultJSONProvider.default)
+
+bp = Blueprint("api", __name__)
+
 
 def register_routes(app):
     """Register all API routes"""
+    app.register_blueprint(bp)
 
-    @app.route("/api/chat", methods=["POST"])
-    def chat():
-        """
-        Main chat endpoint - FULL INTEGRATION.
-        
-        Flow:
-        1. Intent Classification (ML)
-        2. Route to Control (score-based routing)
-        3. Execute DB Queries (read-only, sanitized)
-        4. Call Ollama for Summary
-        5. Return Response
-        
-        Request JSON:
-        {
-            "prompt": "concurrent manager sağlık durumu nedir?",
-            "session_id": "optional-session-id"
-        }
-        
-        Response JSON:
-        {
-            "request_id": "req-uuid",
-            "intent": "ebs_control",
-            "intent_confidence": 0.92,
-            "response": "✓ Concurrent Managers: OK...",
+
+@bp.route("/api/chat", methods=["POST"])
+def chat():
+    """
+    Main chat endpoint - FULL INTEGRATION.
+
+    Flow:
+    1. Intent Classification (ML)
+    2. Route to Control (score-based routing)
+    3. Execute DB Queries (read-only, sanitized)
+    4. Call Ollama for Summary
+    5. Return Response
+
+    Request JSON:
+    {
+        "prompt": "concurrent manager sağlık durumu nedir?",
+        "session_id": "optional-session-id"
+    }
+
+    Response JSON:
+    {
+        "request_id": "req-uuid",
+        "intent": "ebs_control",
+        "intent_confidence": 0.92,
+        "response": "✓ Concurrent Managers: OK...",
+        "verdict": "OK",
+        "execution_time_ms": 1234
+    }
+    """
+    request_id = os.urandom(4).hex()
+    start_ns = time.perf_counter_ns()
+    timestamp = datetime.utcnow().isoformat()
+
+    try:
+        # Parse + validate request (shared with /api/chat/stream)
+        user_prompt, session_id, error = _parse_chat_request(request_id)
+        if error:
+            return error
+
+        # ===== STEP 1: Intent Classification =====
+        logger.debug("[%s] STEP 1: Starting intent classification", request_id)
+        intent_classifier = current_app.config.get("intent_classifier")
+        if not intent_classifier:
+            logger.error(f"[{request_id}] Intent classifier not initialized")
+            return _error_response(request_id, "Intent classifier not initialized", 500)
+
+        # Same (exact, then semantically equivalent) question answered recently => skip STEP 1-5
+        cached_payload, cache_tier, cache_keys = _lookup_response_caches(user_prompt, intent_classifier)
+        if cached_payload is not None:
+            return _cached_chat_response(cached_payload, cache_tier, request_id, session_id, start_ns, timestamp)
+
+        intent_start = time.perf_counter_ns()
+        intent_result = intent_classifier.classify(user_prompt)
+        intent_time_ms = _elapsed_ms(intent_start)
+        logger.info(
+            "[%s] Intent classified: %s (%.1f%%), duration=%.0fms",
+            request_id, intent_result.intent, intent_result.confidence * 100, intent_time_ms
+        )
+
+        # ===== STEP 2: Routing (if EBS control) =====
+        logger.debug("[%s] STEP 2: Processing intent=%s", request_id, intent_result.intent)
+        handler = _INTENT_HANDLERS.get(intent_result.intent, _handle_unknown)
+        payload, status = handler(
+            request_id, session_id, user_prompt, intent_result, start_ns, timestamp, intent_time_ms
+        )
+
+        if status == 200 and cache_keys:
+            _store_response_caches(payload, cache_keys)
+
+        return _chat_json_response(payload, status)
+
+    except Exception as e:
+        logger.error(
+            f"[{request_id}] Chat request failed: {type(e).__name__}: {e}",
+            exc_info=True
+        )
+        return _error_response(request_id, "İşlem sırasında bir hata oluştu.", 500, str(e))
+
+
+# ===== Intent Handlers =====
+# Each handler finishes a /api/chat request for one intent class and
+# returns the (payload, status) tuple; chat() caches and encodes the
+# payload. Dispatch is via _INTENT_HANDLERS.
+
+def _handle_chit_chat(
+    request_id: str,
+    session_id: str,
+    user_prompt: str,
+    intent_result,
+    start_ns: int,
+    timestamp: str,
+    intent_time_ms: float,
+) -> tuple:
+    """Chit-chat: generic response without touching the DB."""
+    logger.debug("[%s] Routing chit-chat to generic response", request_id)
+    response_text = _generate_chit_chat_response(user_prompt)
+
+    execution_time_ms = _elapsed_ms(start_ns)
+    logger.info(
+        "[%s] Chit-chat response ready: %d chars, total_time=%.0fms",
+        request_id, len(response_text), execution_time_ms,
+    )
+    latency_metrics.record("chit_chat", intent_time_ms, total_ms=execution_time_ms)
+    return {
+        "request_id": request_id,
+        "session_id": session_id,
+        "intent": "chit_chat",
+        "intent_confidence": intent_result.confidence,
+        "response": response_text,
+        "verdict": "OK",
+        "execution_time_ms": execution_time_ms,
+        "timestamp": timestamp
+    }, 200
+
+
+def _handle_ebs_control(
+    request_id: str,
+    session_id: str,
+    user_prompt: str,
+    intent_result,
+    start_ns: int,
+    timestamp: str,
+    intent_time_ms: float,
+) -> tuple:
+    """EBS control / ambiguous: route, execute control queries, summarize with Ollama."""
+    router = current_app.config.get("score_based_router")
+    catalog = current_app.config.get("control_catalog")
+    if not router or not catalog:
+        return _error_payload(request_id, "Router or catalog not initialized", 500)
+
+    logger.debug("[%s] Routing to control selection (intent=%s)", request_id, intent_result.intent)
+    router_decision = router.route(user_prompt, intent_result.intent)
+    logger.info(
+        "[%s] Router: selected=%s, confidence=%.3f, ambiguous=%s",
+        request_id, router_decision.selected_control_id,
+        router_decision.confidence, router_decision.ambiguity_threshold_breach
+    )
+
+    # ===== ADAPTIVE ROUTING: Low Score Detection =====
+    # Per AGENTS.md: If match score is too low, treat as chit-chat
+    if (not router_decision.selected_control_id or 
+        router_decision.confidence < CHIT_CHAT_SCORE_THRESHOLD):
+
+        # Low confidence score -> route to Ollama for general chat
+        logger.info(
+            "[%s] Low match score (%.3f), routing to Ollama for chat response",
+            request_id, router_decision.confidence,
+        )
+
+        ollama_client = current_app.config.get("ollama_client")
+        if not ollama_client:
+            return _error_payload(request_id, "Ollama client not initialized", 500)
+
+        ollama_start = time.perf_counter_ns()
+        response_text = ollama_client.generate_chat_response(user_prompt)
+        ollama_time_ms = _elapsed_ms(ollama_start)
+
+        if not response_text:
+            # Fallback to generic response if Ollama fails
+            response_text = (
+                "Üzgünüm, sorunuzu anlayamadım. "
+                "Lütfen EBS sistemine ilişkin spesifik bir soru sorun."
+            )
+            logger.warning("[%s] Ollama chat failed, using fallback response", request_id)
+        else:
+            logger.info(
+                "[%s] Chat response generated (%d chars, %.0fms)",
+                request_id, len(response_text), ollama_time_ms,
+            )
+
+        execution_time_ms = _elapsed_ms(start_ns)
+        logger.info("[%s] Chat request completed: total_time=%.0fms", request_id, execution_time_ms)
+        latency_metrics.record("chit_chat", intent_time_ms, ollama_ms=ollama_time_ms, total_ms=execution_time_ms)
+
+        return {
+            "request_id": request_id,
+            "session_id": session_id,
+            "intent": "chit_chat",
+            "intent_confidence": router_decision.confidence,
+            "response": response_text,
             "verdict": "OK",
-            "execution_time_ms": 1234
-        }
-        """
-        request_id = str(uuid.uuid4())[:8]
-        start_time = datetime.utcnow()
+            "execution_time_ms": execution_time_ms,
+            "timestamp": timestamp
+        }, 200
+
+    # Original logic: Ambiguous case (but confidence above threshold)
+    if router_decision.ambiguity_threshold_breach:
+        logger.warning(
+            "[%s] Router ambiguous: confidence=%.3f, will ask clarification with %d suggestions",
+            request_id, router_decision.confidence, len(router_decision.suggested_interpretations),
+        )
+        response_text = _clarification_text(router_decision.suggested_interpretations)
+
+        execution_time_ms = _elapsed_ms(start_ns)
+        logger.info("[%s] Ambiguous response ready: total_time=%.0fms", request_id, execution_time_ms)
+        latency_metrics.record("ambiguous", intent_time_ms, total_ms=execution_time_ms)
+        return {
+            "request_id": request_id,
+            "session_id": session_id,
+            "intent": "ambiguous",
+            "intent_confidence": intent_result.confidence,
+            "response": response_text,
+            "verdict": "UNKNOWN",
+            "execution_time_ms": execution_time_ms,
+            "timestamp": timestamp
+        }, 200
+
+    # ===== STEP 3: DB Query Execution =====
+    logger.debug("[%s] STEP 3: Starting DB query execution", request_id)
+    control = catalog.get_control(router_decision.selected_control_id)
+    if not control:
+        logger.error(f"[{request_id}] Control not found: {router_decision.selected_control_id}")
+        return _error_payload(request_id, f"Control not found: {router_decision.selected_control_id}", 500)
+
+    logger.debug("[%s] Control loaded: %s v%s", request_id, control.control_id, control.version)
+
+    executor = current_app.config.get("query_executor")
+    if not executor:
+        logger.error(f"[{request_id}] Query executor not initialized")
+        return _error_payload(request_id, "Query executor not initialized", 500)
+
+    db_start = time.perf_counter_ns()
+    logger.debug("[%s] Executing %d queries from control", request_id, len(control.queries))
 
+    exec_result = executor.execute_control(control, {})  # No binds for now
+
+    db_time_ms = _elapsed_ms(db_start)
+    if logger.isEnabledFor(logging.INFO):
+        total_rows = error_count = 0
+        for qr in exec_result.query_results:  # one pass for both counters
+            total_rows += len(qr.rows)
+            if qr.error:
+                error_count += 1
+        logger.info(
+            "[%s] DB execution completed: %d query results, total_rows=%d, duration=%.0fms, errors=%d",
+            request_id, len(exec_result.query_results), total_rows, db_time_ms, error_count,
+        )
+
+    if exec_result.has_errors:
+        logger.error(f"[{request_id}] DB execution errors: {exec_result.errors}")
+        return _error_payload(request_id, "DB query execution failed", 500)
+
+    # ===== STEP 4: Ollama Summarization =====
+    logger.debug("[%s] STEP 4: Starting Ollama summarization", request_id)
+
+    ollama_client = current_app.config.get("ollama_client")
+    prompt_builder = current_app.config.get("prompt_builder")
+    if not ollama_client or not prompt_builder:
+        logger.error(f"[{request_id}] Ollama client or prompt builder not initialized")
+        return _error_payload(request_id, "Ollama client or prompt builder not initialized", 500)
+
+    logger.debug("[%s] Building prompts for control: %s", request_id, control.control_id)
+    system_prompt = current_app.config.get("system_prompt") or prompt_builder.build_system_prompt()
+
+    # Identical DB results + question => reuse previous summary
+    summary_cache = current_app.config.get("summary_cache")
+    cache_key = summary_cache.make_key(exec_result, user_prompt) if summary_cache else None
+    cached_summary = summary_cache.get(cache_key) if summary_cache else None
+
+    ollama_start = time.perf_counter_ns()
+    if cached_summary:
+        logger.info("[%s] Summary cache hit, skipping Ollama", request_id)
+        summary_response = cached_summary
+    else:
+        # Context (rows rendered as text) is only needed when Ollama is called
+        context_prompt = prompt_builder.build_context_prompt(control, exec_result)
+        logger.debug("[%s] System prompt len=%d, context len=%d", request_id, len(system_prompt), len(context_prompt))
+        logger.debug("[%s] Calling Ollama with model=%s", request_id, ollama_client.model_name)
+        summary_response = ollama_client.summarize(system_prompt, context_prompt, user_prompt)
+        if summary_response and summary_cache:
+            summary_cache.put(cache_key, summary_response)
+    ollama_time_ms = _elapsed_ms(ollama_start)
+
+    if not summary_response:
+        logger.warning("[%s] Ollama summarization failed/empty, returning fallback summary", request_id)
+        summary_response = _generate_fallback_summary(exec_result, control)
+    elif not cached_summary:
+        logger.info(
+            "[%s] Ollama response: verdict=%s, summary_bullets=%d, duration=%.0fms",
+            request_id, summary_response.verdict, len(summary_response.summary_bullets), ollama_time_ms,
+        )
+
+    # ===== STEP 5: Response Formatting =====
+    logger.debug("[%s] STEP 5: Formatting response", request_id)
+    response_text = _format_response(summary_response, request_id)
+    logger.debug("[%s] Response formatted: %d chars, verdict=%s", request_id, len(response_text), summary_response.verdict)
+
+    execution_time_ms = _elapsed_ms(start_ns)
+    logger.info(
+        "[%s] Chat request completed: intent=%s, control=%s, verdict=%s, "
+        "total_time=%.0fms (intent=%.0fms, db=%.0fms, ollama=%.0fms)",
+        request_id, intent_result.intent, router_decision.selected_control_id, summary_response.verdict,
+        execution_time_ms, intent_time_ms, db_time_ms, ollama_time_ms,
+    )
+    latency_metrics.record("ebs_control", intent_time_ms, db_time_ms, ollama_time_ms, execution_time_ms)
+
+    # Prepare raw data for UI details panel (max 100 rows)
+    raw_data = []
+    if exec_result.query_results:
+        for qr in exec_result.query_results:
+            if qr.rows:
+                raw_data.extend(qr.rows[:100])  # Max 100 rows total
+                if len(raw_data) >= 100:
+                    break
+
+    return {
+        "request_id": request_id,
+        "session_id": session_id,
+        "intent": intent_result.intent,
+        "intent_confidence": intent_result.confidence,
+        "selected_control": router_decision.selected_control_id,
+        "response": response_text,
+        "verdict": _verdict_value(summary_response.verdict),
+        "raw_data": raw_data[:100],  # First 100 rows for details panel
+        "raw_data_count": sum(qr.row_count for qr in exec_result.query_results if not qr.error),
+        "execution_time_ms": execution_time_ms,
+        "db_time_ms": db_time_ms,
+        "ollama_time_ms": ollama_time_ms,
+        "timestamp": timestamp
+    }, 200
+
+
+def _handle_unknown(
+    request_id: str,
+    session_id: str,
+    user_prompt: str,
+    intent_result,
+    start_ns: int,
+    timestamp: str,
+    intent_time_ms: float,
+) -> tuple:
+    """Unknown intent: ask the user to rephrase."""
+    logger.warning("[%s] Unknown intent: %s", request_id, intent_result.intent)
+    response_text = "Sorunuzu tam olarak anlayamadım. EBS ile ilgili bir soru sorabilir misiniz?"
+    execution_time_ms = _elapsed_ms(start_ns)
+    logger.info("[%s] Unknown intent response ready: total_time=%.0fms", request_id, execution_time_ms)
+    latency_metrics.record("unknown", intent_time_ms, total_ms=execution_time_ms)
+    return {
+        "request_id": request_id,
+        "session_id": session_id,
+        "intent": "unknown",
+        "intent_confidence": 0.0,
+        "response": response_text,
+        "verdict": "UNKNOWN",
+        "execution_time_ms": execution_time_ms,
+        "timestamp": timestamp
+    }, 200
+
+
+_INTENT_HANDLERS = {
+    "chit_chat": _handle_chit_chat,
+    "ebs_control": _handle_ebs_control,
+    "ambiguous": _handle_ebs_control,
+}
+
+
+@bp.route("/api/chat/stream", methods=["POST"])
+def chat_stream():
+    """
+    Streaming variant of /api/chat (Server-Sent Events).
+
+    Same pipeline as chat(), but Ollama tokens are forwarded as they are
+    generated instead of waiting for the full summary. Each frame is
+    ``data: {json}\\n\\n`` with a ``type`` field:
+
+    - intent:  classification + routing result
+    - db_done: query/row counts and DB duration
+    - token:   Ollama text, forwarded once it passes the leakage check
+    - done:    final formatted payload (same fields as /api/chat)
+    - error:   failure message
+
+    The buffered /api/chat endpoint is kept for back-compat.
+    """
+    request_id = os.urandom(4).hex()
+    start_ns = time.perf_counter_ns()
+    timestamp = datetime.utcnow().isoformat()
+
+    user_prompt, session_id, error = _parse_chat_request(request_id)
+    if error:
+        return error
+
+    def generate():
         try:
-            # Parse request
-            data = request.get_json(force=True)
-            user_prompt = data.get("prompt", "").strip()
-            session_id = data.get("session_id", "default")
-
-            if not user_prompt:
-                return jsonify({
-                    "error": "Lütfen bir soru sorun.",
-                    "request_id": request_id
-                }), 400
-
-            # ===== SECURITY: Input Validation & Sanitization =====
-            # Per SECURITY.MD § 3.1 (Input Validation)
-            try:
-                sanitized_prompt, is_suspicious, warning_msg = PromptInjectionDetector.validate_and_sanitize(
-                    user_prompt, request_id
-                )
-                
-                if is_suspicious:
-                    logger.error(
-                        f"[{request_id}] INJECTION ATTEMPT FLAGGED: '{user_prompt[:100]}'"
-                    )
-                    # Log to security audit trail
-                    # In production: could block, rate-limit, or notify security team
-                    return jsonify({
-                        "error": warning_msg,
-                        "request_id": request_id,
-                        "security_flag": True
-                    }), 400
-                
-                # Use sanitized prompt from here on
-                user_prompt = sanitized_prompt
-                logger.info(f"[{request_id}] Chat request (sanitized): '{user_prompt[:100]}'")
-                
-            except InputValidationError as e:
-                logger.warning(f"[{request_id}] Input validation failed: {e}")
-                return jsonify({
-                    "error": str(e),
-                    "request_id": request_id
-                }), 400
-
-            # ===== STEP 1: Intent Classification =====
-            logger.debug(f"[{request_id}] STEP 1: Starting intent classification")
             intent_classifier = current_app.config.get("intent_classifier")
-            if not intent_classifier:
-                logger.error(f"[{request_id}] Intent classifier not initialized")
-                return _error_response(request_id, "Intent classifier not initialized", 500)
+            router = current_app.config.get("score_based_router")
+            catalog = current_app.config.get("control_catalog")
+            executor = current_app.config.get("query_executor")
+            ollama_client = current_app.config.get("ollama_client")
+            prompt_builder = current_app.config.get("prompt_builder")
+            if not all((intent_classifier, router, catalog, executor, ollama_client, prompt_builder)):
+                yield _stream_error_frame(request_id, "System components not initialized")
+                return
 
-            intent_start = datetime.utcnow()
-            intent_result = intent_classifier.classify(user_prompt)
-            intent_time_ms = (datetime.utcnow() - intent_start).total_seconds() * 1000
-            logger.info(f"[{request_id}] Intent classified: {intent_result.intent} ({intent_result.confidence:.1%}), duration={intent_time_ms:.0f}ms")
-
-            # ===== STEP 2: Routing (if EBS control) =====
-            logger.debug(f"[{request_id}] STEP 2: Processing intent={intent_result.intent}")
-            if intent_result.intent == "chit_chat":
-                # Direct to Ollama for generic response
-                logger.debug(f"[{request_id}] Routing chit-chat to generic response")
-                response_text = _generate_chit_chat_response(user_prompt)
-                
-                execution_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-                logger.info(f"[{request_id}] Chit-chat response ready: {len(response_text)} chars, total_time={execution_time_ms:.0f}ms")
-                return jsonify({
+            cached_payload, cache_tier, cache_keys = _lookup_response_caches(user_prompt, intent_classifier)
+            if cached_payload is not None:
+                _audit_cache_hit(request_id, cache_tier, cached_payload)
+                yield _sse_frame({
+                    "type": "done",
+                    **cached_payload,
                     "request_id": request_id,
                     "session_id": session_id,
-                    "intent": "chit_chat",
-                    "intent_confidence": intent_result.confidence,
+                    "cache_hit": cache_tier,
+                    "cached_at": cached_payload.get("timestamp"),
+                    "execution_time_ms": _elapsed_ms(start_ns),
+                    "db_time_ms": 0.0,
+                    "ollama_time_ms": 0.0,
+                    "timestamp": timestamp,
+                })
+                return
+
+            intent_start = time.perf_counter_ns()
+            intent_result = intent_classifier.classify(user_prompt)
+            intent_time_ms = _elapsed_ms(intent_start)
+            logger.info(
+                "[%s] Stream intent classified: %s (%.1f%%), duration=%.0fms",
+                request_id, intent_result.intent, intent_result.confidence * 100, intent_time_ms,
+            )
+
+            base = {
+                "request_id": request_id,
+                "session_id": session_id,
+                "intent": intent_result.intent,
+                "intent_confidence": intent_result.confidence,
+                "timestamp": timestamp,
+            }
+
+            if intent_result.intent not in ["ebs_control", "ambiguous"]:
+                yield _sse_frame({"type": "intent", **base})
+                if intent_result.intent == "chit_chat":
+                    response_text, verdict = _generate_chit_chat_response(user_prompt), "OK"
+                else:
+                    base["intent"], base["intent_confidence"] = "unknown", 0.0
+                    response_text = "Sorunuzu tam olarak anlayamadım. EBS ile ilgili bir soru sorabilir misiniz?"
+                    verdict = "UNKNOWN"
+                execution_time_ms = _elapsed_ms(start_ns)
+                latency_metrics.record(base["intent"], intent_time_ms, total_ms=execution_time_ms)
+                yield _sse_frame({
+                    "type": "done", **base,
                     "response": response_text,
-                    "verdict": "OK",
+                    "verdict": verdict,
                     "execution_time_ms": execution_time_ms,
-                    "timestamp": start_time.isoformat()
-                }), 200
-
-            elif intent_result.intent in ["ebs_control", "ambiguous"]:
-                # Route to specific control
-                router = current_app.config.get("score_based_router")
-                catalog = current_app.config.get("control_catalog")
-                if not router or not catalog:
-                    return _error_response(request_id, "Router or catalog not initialized", 500)
-
-                logger.debug(f"[{request_id}] Routing to control selection (intent={intent_result.intent})")
-                router_decision = router.route(user_prompt, intent_result.intent)
-                logger.info(
-                    f"[{request_id}] Router: selected={router_decision.selected_control_id}, "
-                    f"confidence={router_decision.confidence:.3f}, "
-                    f"ambiguous={router_decision.ambiguity_threshold_breach}"
-                )
+                })
+                return
 
-                # ===== ADAPTIVE ROUTING: Low Score Detection =====
-                # Per AGENTS.md: If match score is too low, treat as chit-chat
-                # Use threshold of 0.10 (10% normalized score)
-                CHIT_CHAT_SCORE_THRESHOLD = 0.10
-                
-                if (not router_decision.selected_control_id or 
+            router_decision = router.route(user_prompt, intent_result.intent)
+            yield _sse_frame({"type": "intent", **base, "selected_control": router_decision.selected_control_id})
+
+            # Low score -> generic Ollama chat (not streamed, short output)
+            if (not router_decision.selected_control_id or
                     router_decision.confidence < CHIT_CHAT_SCORE_THRESHOLD):
-                    
-                    # Low confidence score -> route to Ollama for general chat
-                    logger.info(
-                        f"[{request_id}] Low match score ({router_decision.confidence:.3f}), "
-                        f"routing to Ollama for chat response"
-                    )
-                    
-                    ollama_client = current_app.config.get("ollama_client")
-                    if not ollama_client:
-                        return _error_response(request_id, "Ollama client not initialized", 500)
-                    
-                    ollama_start = datetime.utcnow()
-                    response_text = ollama_client.generate_chat_response(user_prompt)
-                    ollama_time_ms = (datetime.utcnow() - ollama_start).total_seconds() * 1000
-                    
-                    if not response_text:
-                        # Fallback to generic response if Ollama fails
-                        response_text = (
-                            "Üzgünüm, sorunuzu anlayamadım. "
-                            "Lütfen EBS sistemine ilişkin spesifik bir soru sorun."
-                        )
-                        logger.warning(f"[{request_id}] Ollama chat failed, using fallback response")
-                    else:
-                        logger.info(f"[{request_id}] Chat response generated ({len(response_text)} chars, {ollama_time_ms:.0f}ms)")
-                    
-                    execution_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-                    logger.info(f"[{request_id}] Chat request completed: total_time={execution_time_ms:.0f}ms")
-                    
-                    return jsonify({
-                        "request_id": request_id,
-                        "session_id": session_id,
-                        "intent": "chit_chat",
-                        "intent_confidence": router_decision.confidence,
-                        "response": response_text,
-                        "verdict": "OK",
-                        "execution_time_ms": execution_time_ms,
-                        "timestamp": start_time.isoformat()
-                    }), 200
-                
-                # Original logic: Ambiguous case (but confidence above threshold)
-                if router_decision.ambiguity_threshold_breach:
-                    logger.warning(
-                        f"[{request_id}] Router ambiguous: confidence={router_decision.confidence:.3f}, "
-                        f"will ask clarification with {len(router_decision.suggested_interpretations)} suggestions"
-                    )
-                    response_text = f"Sorunuzu daha net açıklamış olabilir misiniz? Örneğin:\n"
-                    for interp in router_decision.suggested_interpretations[:3]:
-                        response_text += f"\n- {interp}"
-                    
-                    execution_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-                    logger.info(f"[{request_id}] Ambiguous response ready: total_time={execution_time_ms:.0f}ms")
-                    return jsonify({
-                        "request_id": request_id,
-                        "session_id": session_id,
-                        "intent": "ambiguous",
-                        "intent_confidence": intent_result.confidence,
-                        "response": response_text,
-                        "verdict": "UNKNOWN",
-                        "execution_time_ms": execution_time_ms,
-                        "timestamp": start_time.isoformat()
-                    }), 200
-
-                # ===== STEP 3: DB Query Execution =====
-                logger.debug(f"[{request_id}] STEP 3: Starting DB query execution")
-                control = catalog.get_control(router_decision.selected_control_id)
-                if not control:
-                    logger.error(f"[{request_id}] Control not found: {router_decision.selected_control_id}")
-                    return _error_response(request_id, f"Control not found: {router_decision.selected_control_id}", 500)
-
-                logger.debug(f"[{request_id}] Control loaded: {control.control_id} v{control.version}")
-
-                executor = current_app.config.get("query_executor")
-                if not executor:
-                    logger.error(f"[{request_id}] Query executor not initialized")
-                    return _error_response(request_id, "Query executor not initialized", 500)
-
-                db_start = datetime.utcnow()
-                logger.debug(f"[{request_id}] Executing {len(control.queries)} queries from control")
-                
-                exec_result = executor.execute_control(control, {})  # No binds for now
-                
-                db_time_ms = (datetime.utcnow() - db_start).total_seconds() * 1000
-                error_count = len([qr for qr in exec_result.query_results if qr.error])
-                logger.info(
-                    f"[{request_id}] DB execution completed: {len(exec_result.query_results)} query results, "
-                    f"total_rows={sum(len(qr.rows) for qr in exec_result.query_results)}, "
-                    f"duration={db_time_ms:.0f}ms, errors={error_count}"
-                )
-                
-                if exec_result.has_errors:
-                    logger.error(f"[{request_id}] DB execution errors: {exec_result.errors}")
-                    return _error_response(request_id, "DB query execution failed", 500)
-
-                # ===== STEP 4: Ollama Summarization =====
-                logger.debug(f"[{request_id}] STEP 4: Starting Ollama summarization")
-                
-                ollama_client = current_app.config.get("ollama_client")
-                prompt_builder = current_app.config.get("prompt_builder")
-                if not ollama_client or not prompt_builder:
-                    logger.error(f"[{request_id}] Ollama client or prompt builder not initialized")
-                    return _error_response(request_id, "Ollama client or prompt builder not initialized", 500)
-
-                logger.debug(f"[{request_id}] Building prompts for control: {control.control_id}")
-                system_prompt = prompt_builder.build_system_prompt()
-                context_prompt = prompt_builder.build_context_prompt(control, exec_result)
-                logger.debug(f"[{request_id}] System prompt len={len(system_prompt)}, context len={len(context_prompt)}")
-                
-                ollama_start = datetime.utcnow()
-                logger.debug(f"[{request_id}] Calling Ollama with model={ollama_client.model_name}")
-                summary_response = ollama_client.summarize(system_prompt, context_prompt, user_prompt)
-                ollama_time_ms = (datetime.utcnow() - ollama_start).total_seconds() * 1000
-                
-                if not summary_response:
-                    logger.warning(f"[{request_id}] Ollama summarization failed/empty, returning fallback summary")
-                    summary_response = _generate_fallback_summary(exec_result, control)
-                else:
-                    logger.info(
-                        f"[{request_id}] Ollama response: verdict={summary_response.verdict}, "
-                        f"summary_bullets={len(summary_response.summary_bullets)}, "
-                        f"duration={ollama_time_ms:.0f}ms"
-                    )
-
-                # ===== STEP 5: Response Formatting =====
-                logger.debug(f"[{request_id}] STEP 5: Formatting response")
-                response_text = _format_response(summary_response, request_id)
-                logger.debug(f"[{request_id}] Response formatted: {len(response_text)} chars, verdict={summary_response.verdict}")
-                
-                execution_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-                logger.info(
-                    f"[{request_id}] Chat request completed: "
-                    f"intent={intent_result.intent}, "
-                    f"control={router_decision.selected_control_id}, "
-                    f"verdict={summary_response.verdict}, "
-                    f"total_time={execution_time_ms:.0f}ms "
-                    f"(intent={intent_time_ms:.0f}ms, db={db_time_ms:.0f}ms, ollama={ollama_time_ms:.0f}ms)"
+                ollama_start = time.perf_counter_ns()
+                response_text = ollama_client.generate_chat_response(user_prompt) or (
+                    "Üzgünüm, sorunuzu anlayamadım. "
+                    "Lütfen EBS sistemine ilişkin spesifik bir soru sorun."
                 )
-
-                # Prepare raw data for UI details panel (max 100 rows)
-                raw_data = []
-                if exec_result.query_results:
-                    for qr in exec_result.query_results:
-                        if qr.rows:
-                            raw_data.extend(qr.rows[:100])  # Max 100 rows total
-                            if len(raw_data) >= 100:
-                                break
-                
-                return jsonify({
-                    "request_id": request_id,
-                    "session_id": session_id,
-                    "intent": intent_result.intent,
-                    "intent_confidence": intent_result.confidence,
-                    "selected_control": router_decision.selected_control_id,
+                ollama_time_ms = _elapsed_ms(ollama_start)
+                execution_time_ms = _elapsed_ms(start_ns)
+                latency_metrics.record("chit_chat", intent_time_ms, ollama_ms=ollama_time_ms, total_ms=execution_time_ms)
+                yield _sse_frame({
+                    "type": "done", **base,
+                    "intent": "chit_chat",
+                    "intent_confidence": router_decision.confidence,
                     "response": response_text,
-                    "verdict": summary_response.verdict.value if hasattr(summary_response.verdict, 'value') else str(summary_response.verdict),
-                    "raw_data": raw_data[:100],  # First 100 rows for details panel
-                    "raw_data_count": sum(qr.row_count for qr in exec_result.query_results if not qr.error),
+                    "verdict": "OK",
                     "execution_time_ms": execution_time_ms,
-                    "db_time_ms": db_time_ms,
-                    "ollama_time_ms": ollama_time_ms,
-                    "timestamp": start_time.isoformat()
-                }), 200
+                })
+                return
 
-            else:
-                # Unknown intent
-                logger.warning(f"[{request_id}] Unknown intent: {intent_result.intent}")
-                response_text = "Sorunuzu tam olarak anlayamadım. EBS ile ilgili bir soru sorabilir misiniz?"
-                execution_time_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
-                logger.info(f"[{request_id}] Unknown intent response ready: total_time={execution_time_ms:.0f}ms")
-                return jsonify({
-                    "request_id": request_id,
-                    "session_id": session_id,
-                    "intent": "unknown",
-                    "intent_confidence": 0.0,
+            if router_decision.ambiguity_threshold_breach:
+                response_text = _clarification_text(router_decision.suggested_interpretations)
+                execution_time_ms = _elapsed_ms(start_ns)
+                latency_metrics.record("ambiguous", intent_time_ms, total_ms=execution_time_ms)
+                yield _sse_frame({
+                    "type": "done", **base,
+                    "intent": "ambiguous",
                     "response": response_text,
                     "verdict": "UNKNOWN",
                     "execution_time_ms": execution_time_ms,
-                    "timestamp": start_time.isoformat()
-                }), 200
+                })
+                return
+
+            control = catalog.get_control(router_decision.selected_control_id)
+            if not control:
+                yield _stream_error_frame(request_id, f"Control not found: {router_decision.selected_control_id}")
+                return
+
+            db_start = time.perf_counter_ns()
+            exec_result = executor.execute_control(control, {})
+            db_time_ms = _elapsed_ms(db_start)
+            if exec_result.has_errors:
+                logger.error(f"[{request_id}] DB execution errors: {exec_result.errors}")
+                yield _stream_error_frame(request_id, "DB query execution failed")
+                return
+
+            raw_data = []
+            for qr in exec_result.query_results:
+                if qr.rows:
+                    raw_data.extend(qr.rows[:100])
+                    if len(raw_data) >= 100:
+                        break
+            raw_data_count = sum(qr.row_count for qr in exec_result.query_results if not qr.error)
+            yield _sse_frame({
+                "type": "db_done",
+                "request_id": request_id,
+                "query_count": len(exec_result.query_results),
+                "raw_data_count": raw_data_count,
+                "db_time_ms": db_time_ms,
+            })
+
+            system_prompt = current_app.config.get("system_prompt") or prompt_builder.build_system_prompt()
+
+            summary_cache = current_app.config.get("summary_cache")
+            cache_key = summary_cache.make_key(exec_result, user_prompt) if summary_cache else None
+            summary_response = summary_cache.get(cache_key) if summary_cache else None
+
+            ollama_start = time.perf_counter_ns()
+            if not summary_response:
+                context_prompt = prompt_builder.build_context_prompt(control, exec_result)
+                raw_response = yield from _forward_validated_tokens(
+                    ollama_client.stream_summarize(system_prompt, context_prompt, user_prompt),
+                    request_id,
+                )
+                if raw_response:
+                    try:
+                        summary_response = ollama_client.parse_response(raw_response)
+                    except Exception as e:
+                        logger.warning("[%s] Streamed response parse failed: %s", request_id, e)
+                if summary_response and summary_cache:
+                    summary_cache.put(cache_key, summary_response)
+            else:
+                logger.info("[%s] Summary cache hit, skipping Ollama stream", request_id)
+            ollama_time_ms = _elapsed_ms(ollama_start)
+
+            if not summary_response:
+                logger.warning("[%s] Ollama stream failed/empty, returning fallback summary", request_id)
+                summary_response = _generate_fallback_summary(exec_result, control)
+
+            execution_time_ms = _elapsed_ms(start_ns)
+            logger.info(
+                "[%s] Stream request completed: control=%s, total_time=%.0fms (db=%.0fms, ollama=%.0fms)",
+                request_id, router_decision.selected_control_id, execution_time_ms, db_time_ms, ollama_time_ms,
+            )
+            latency_metrics.record("ebs_control", intent_time_ms, db_time_ms, ollama_time_ms, execution_time_ms)
+            payload = {
+                **base,
+                "selected_control": router_decision.selected_control_id,
+                "response": _format_response(summary_response, request_id),
+                "verdict": _verdict_value(summary_response.verdict),
+                "raw_data": raw_data[:100],
+                "raw_data_count": raw_data_count,
+                "execution_time_ms": execution_time_ms,
+                "db_time_ms": db_time_ms,
+                "ollama_time_ms": ollama_time_ms,
+            }
+            # Encode before caching: a payload that cannot be sent must
+            # not be replayed to later requests
+            done_frame = _sse_frame({"type": "done", **payload})
+            yield done_frame
+            _store_response_caches(payload, cache_keys)
 
         except Exception as e:
             logger.error(
-                f"[{request_id}] Chat request failed: {type(e).__name__}: {e}",
+                f"[{request_id}] Stream request failed: {type(e).__name__}: {e}",
                 exc_info=True
             )
-            return _error_response(request_id, "İşlem sırasında bir hata oluştu.", 500, str(e))
-
-    @app.route("/api/intent", methods=["POST"])
-    def detect_intent():
-        """
-        Intent detection endpoint (for debugging).
-        """
-        request_id = str(uuid.uuid4())[:8]
-        
-        try:
-            data = request.get_json(force=True)
-            user_prompt = data.get("prompt", "").strip()
+            yield _stream_error_frame(request_id, "İşlem sırasında bir hata oluştu.")
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
-            if not user_prompt:
-                return jsonify({"error": "Prompt required"}), 400
+@bp.route("/api/intent", methods=["POST"])
+def detect_intent():
+    """
+    Intent detection endpoint (for debugging).
+    """
+    request_id = os.urandom(4).hex()
 
-            classifier = current_app.config.get("intent_classifier")
-            if not classifier:
-                return jsonify({"error": "Classifier not initialized"}), 500
+    try:
+        # Same body limits + validation as /api/chat (parsed once)
+        user_prompt, _, error = _parse_chat_request(request_id)
+        if error:
+            return error
 
-            result = classifier.classify(user_prompt)
-            return jsonify({
-                "request_id": request_id,
-                "prompt": user_prompt,
-                "intent": result.intent,
-                "confidence": round(result.confidence, 3),
-                "all_scores": {k: round(v, 3) for k, v in result.all_scores.items()}
-            }), 200
+        classifier = current_app.config.get("intent_classifier")
+        if not classifier:
+            return jsonify({"error": "Classifier not initialized"}), 500
 
-        except Exception as e:
-            logger.error(f"Intent detection error: {e}", exc_info=True)
-            return jsonify({"error": str(e), "request_id": request_id}), 500
+        result = classifier.classify(user_prompt)
+        return jsonify({
+            "request_id": request_id,
+            "prompt": user_prompt,
+            "intent": result.intent,
+            "confidence": round(result.confidence, 3),
+            "all_scores": {k: round(v, 3) for k, v in result.all_scores.items()}
+        }), 200
 
-    @app.route("/api/controls", methods=["GET"])
-    def list_controls():
-        """List available controls."""
-        try:
-            catalog = current_app.config.get("control_catalog")
-            if not catalog:
-                return jsonify({"error": "Catalog not initialized"}), 500
-
-            controls = catalog.get_all_controls()
-            control_list = [
-                {
-                    "control_id": c.control_id,
-                    "version": c.version,
-                    "title": c.title,
-                    "intent": c.intent,
-                    "keywords": c.keywords.en[:3] + c.keywords.tr[:3]  # Sample keywords
-                }
-                for c in controls
-            ]
-            
-            return jsonify({
-                "controls": control_list,
-                "total": len(control_list)
-            }), 200
+    except Exception as e:
+        logger.error(f"Intent detection error: {e}", exc_info=True)
+        return jsonify({"error": str(e), "request_id": request_id}), 500
 
-        except Exception as e:
-            logger.error(f"List controls error: {e}", exc_info=True)
-            return jsonify({"error": str(e)}), 500
+@bp.route("/api/controls", methods=["GET"])
+def list_controls():
+    """
+    List available controls.
 
-    @app.route("/api/metrics", methods=["GET"])
-    def get_metrics():
-        """Return observability metrics (local file for now)."""
-        try:
-            # TODO: Load from metrics file (metrics.jsonl)
-            return jsonify({
-                "requests_total": 0,
-                "ebs_control_requests": 0,
-                "avg_response_time_ms": 0,
-                "errors": 0
-            }), 200
+    The catalog is fixed after startup, so the JSON body is serialized once
+    and served with an ETag; clients revalidating with If-None-Match get 304.
+    """
+    try:
+        catalog = current_app.config.get("control_catalog")
+        if not catalog:
+            return jsonify({"error": "Catalog not initialized"}), 500
 
-        except Exception as e:
-            logger.error(f"Get metrics error: {e}", exc_info=True)
-            return jsonify({"error": str(e)}), 500
+        body, etag = _controls_payload(catalog)
+        response = Response(body, mimetype="application/json")
+        response.set_etag(etag)
+        response.cache_control.public = True
+        response.cache_control.max_age = CONTROLS_MAX_AGE_SECONDS
+        return response.make_conditional(request)
+
+    except Exception as e:
+        logger.error(f"List controls error: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
+@bp.route("/api/metrics", methods=["GET"])
+def get_metrics():
+    """Return latency aggregates from the in-memory ring buffer (this worker only)."""
+    try:
+        return jsonify(latency_metrics.snapshot()), 200
+
+    except Exception as e:
+        logger.error(f"Get metrics error: {e}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
 
 
 # ===== Helper Functions =====
 
-def _error_response(request_id: str, error_msg: str, status: int, details: Optional[str] = None) -> tuple:
-    """Return error response JSON"""
-    response = {
+def _controls_payload(catalog) -> Tuple[bytes, str]:
+    """Serialized /api/controls body + ETag, built once per catalog."""
+    cached = current_app.config.get("controls_payload")
+    if cached is not None and cached[0] is catalog:
+        return cached[1], cached[2]
+
+    control_list = [
+        {
+            "control_id": c.control_id,
+            "version": c.version,
+            "title": c.title,
+            "intent": c.intent,
+            "keywords": c.keywords.en[:3] + c.keywords.tr[:3]  # Sample keywords
+        }
+        for c in catalog.get_all_controls()
+    ]
+    body = current_app.json.dumps({"controls": control_list, "total": len(control_list)}).encode()
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+
+    current_app.config["controls_payload"] = (catalog, body, etag)
+    return body, etag
+
+
+def _verdict_value(verdict) -> str:
+    """Verdict as its plain string ("OK", "WARN", ...), enum or not."""
+    return str(getattr(verdict, "value", verdict))
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading (monotonic)."""
+    return (time.perf_counter_ns() - start_ns) / 1_000_000
+
+
+def _chat_json_response(payload: Dict[str, Any], status: int = 200) -> tuple:
+    """Serialize a /api/chat payload with the shared compact encoder."""
+    return Response(_CHAT_JSON_ENCODER.encode(payload), mimetype="application/json"), status
+
+
+def _error_payload(request_id: str, error_msg: str, status: int, details: Optional[str] = None) -> tuple:
+    """Return (error payload, status) (server-side failures count toward /api/metrics errors)"""
+    if status >= 500:
+        latency_metrics.record_error()
+    payload = {
         "error": error_msg,
         "request_id": request_id,
     }
     if details:
-        response["details"] = details
-    return jsonify(response), status
+        payload["details"] = details
+    return payload, status
+
+
+def _error_response(request_id: str, error_msg: str, status: int, details: Optional[str] = None) -> tuple:
+    """Return error response JSON (see _error_payload)"""
+    return _chat_json_response(*_error_payload(request_id, error_msg, status, details))
+
+
+def _lookup_response_caches(user_prompt: str, intent_classifier) -> tuple:
+    """
+    Check exact, then semantic response cache.
+
+    Returns:
+        (payload, tier, cache_keys) - payload/tier are None on miss;
+        cache_keys is passed back to _store_response_caches()
+    """
+    exact_cache = current_app.config.get("exact_cache")
+    response_cache = current_app.config.get("response_cache")
+    cache_keys = {}
+
+    if exact_cache is not None:
+        cache_keys["exact"] = exact_cache.make_key(user_prompt)
+        payload = exact_cache.get(cache_keys["exact"])
+        if payload is not None:
+            return payload, "exact", cache_keys
+
+    if response_cache is not None:
+        # Out-of-vocabulary words are invisible to the embedding: require
+        # them to match too, so "X nedir" and "Y nedir" never share a reply
+        cache_keys["semantic"] = (
+            intent_classifier.embed(user_prompt), intent_classifier.unknown_terms(user_prompt)
+        )
+        payload = response_cache.lookup(*cache_keys["semantic"])
+        if payload is not None:
+            return payload, "semantic", cache_keys
+
+    return None, None, cache_keys
+
+
+def _store_response_caches(payload: Dict[str, Any], cache_keys: Dict[str, Any]) -> None:
+    """
+    Store a successful chat payload in the response caches.
+
+    Both tiers hold only chat answers: a hit skips routing, so control
+    answers must come from a fresh DB run (the summary cache already
+    skips Ollama when the results are unchanged), and ambiguous/unknown
+    answers are not final.
+    """
+    if payload.get("intent") != "chit_chat":
+        return
+    if "exact" in cache_keys:
+        current_app.config["exact_cache"].put(cache_keys["exact"], payload)
+    if "semantic" in cache_keys:
+        query_vec, unknown_terms = cache_keys["semantic"]
+        current_app.config["response_cache"].put(query_vec, payload, unknown_terms)
+
+
+def _audit_cache_hit(request_id: str, cache_tier: str, cached_payload: Dict[str, Any]) -> None:
+    """
+    Audit line for a response served from cache (AGENTS.md § 8.3): nothing
+    was routed or executed, so record which earlier request produced it.
+    """
+    logger.info(
+        "[%s] AUDIT cache_hit tier=%s source_request_id=%s cached_at=%s intent=%s control=%s",
+        request_id, cache_tier, cached_payload.get("request_id"), cached_payload.get("timestamp"),
+        cached_payload.get("intent"), cached_payload.get("selected_control"),
+    )
+
+
+def _cached_chat_response(
+    cached_payload: Dict[str, Any],
+    cache_tier: str,
+    request_id: str,
+    session_id: str,
+    start_ns: int,
+    timestamp: str,
+) -> tuple:
+    """Re-issue a cached /api/chat payload with this request's identity and timing."""
+    execution_time_ms = _elapsed_ms(start_ns)
+    _audit_cache_hit(request_id, cache_tier, cached_payload)
+    latency_metrics.record(cached_payload["intent"], total_ms=execution_time_ms)
+    return _chat_json_response({
+        **cached_payload,
+        "request_id": request_id,
+        "session_id": session_id,
+        "cache_hit": cache_tier,
+        "cached_at": cached_payload.get("timestamp"),
+        "execution_time_ms": execution_time_ms,
+        "db_time_ms": 0.0,
+        "ollama_time_ms": 0.0,
+        "timestamp": timestamp
+    })
+
+
+def _parse_chat_request(request_id: str) -> tuple:
+    """
+    Parse and validate the chat request body.
+
+    Per SECURITY.MD § 3.1 (Input Validation).
+
+    Returns:
+        (sanitized_prompt, session_id, None) on success,
+        (None, None, error_response) if the request must be rejected
+    """
+    # Reject oversized bodies before reading them
+    if request.content_length is not None and request.content_length > MAX_CHAT_BODY_BYTES:
+        return None, None, _chat_json_response({
+            "error": "İstek çok büyük.",
+            "request_id": request_id
+        }, 413)
+
+    raw = request.get_data(cache=False)
+    if len(raw) > MAX_CHAT_BODY_BYTES:
+        return None, None, _chat_json_response({
+            "error": "İstek çok büyük.",
+            "request_id": request_id
+        }, 413)
+
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        data = None
+    if not isinstance(data, dict):
+        return None, None, _chat_json_response({
+            "error": "Geçersiz JSON isteği.",
+            "request_id": request_id
+        }, 400)
+
+    user_prompt = data.get("prompt", "")
+    user_prompt = user_prompt.strip() if isinstance(user_prompt, str) else ""
+    session_id = data.get("session_id", "default")
+
+    if not user_prompt:
+        return None, None, _chat_json_response({
+            "error": "Lütfen bir soru sorun.",
+            "request_id": request_id
+        }, 400)
+
+    try:
+        sanitized_prompt, is_suspicious, warning_msg = PromptInjectionDetector.validate_and_sanitize(
+            user_prompt, request_id
+        )
+    except InputValidationError as e:
+        logger.warning(f"[{request_id}] Input validation failed: {e}")
+        return None, None, _chat_json_response({
+            "error": str(e),
+            "request_id": request_id
+        }, 400)
+
+    if is_suspicious:
+        logger.error(
+            f"[{request_id}] INJECTION ATTEMPT FLAGGED: '{user_prompt[:100]}'"
+        )
+        # Log to security audit trail
+        # In production: could block, rate-limit, or notify security team
+        return None, None, _chat_json_response({
+            "error": warning_msg,
+            "request_id": request_id,
+            "security_flag": True
+        }, 400)
+
+    logger.info("[%s] Chat request (sanitized): '%s'", request_id, sanitized_prompt[:100])
+    return sanitized_prompt, session_id, None
+
+
+def _clarification_text(suggestions: list) -> str:
+    """Clarification prompt listing up to 3 suggested interpretations."""
+    top = suggestions[:3]
+    if not top:
+        return "Sorunuzu daha net açıklamış olabilir misiniz?"
+    return "Sorunuzu daha net açıklamış olabilir misiniz? Örneğin:\n\n- " + "\n- ".join(top)
+
+
+def _sse_frame(payload: Dict[str, Any]) -> str:
+    """Encode a payload as a single Server-Sent Events data frame."""
+    return f"data: {_SSE_JSON_ENCODER.encode(payload)}\n\n"
+
+
+def _stream_error_frame(request_id: str, error_msg: str) -> str:
+    """Encode a stream error frame (counts toward /api/metrics errors, as _error_payload)"""
+    latency_metrics.record_error()
+    return _sse_frame({"type": "error", "error": error_msg, "request_id": request_id})
+
+
+def _forward_validated_tokens(chunks: Iterator[str], request_id: str) -> Generator[str, None, Optional[str]]:
+    """
+    Forward streamed Ollama text as SSE token frames, leakage-checked.
+
+    Per SECURITY.MD § 3.3 (Output Validation), same check as summarize():
+    text is forwarded only once everything received so far is free of
+    leakage markers, and the tail that could still become one is held
+    back until the full response passes validate_output(). On leakage the
+    stream is abandoned and nothing more is sent.
+
+    Returns:
+        The full (stripped) response text if it passed validation, else None
+    """
+    raw_response = ""
+    sent = 0
+    for chunk in chunks:
+        raw_response += chunk
+        if PromptInjectionDetector.find_output_leakage(raw_response):
+            break
+        releasable = PromptInjectionDetector.releasable_output_length(raw_response)
+        if releasable > sent:
+            yield _format_response_chunk(raw_response[sent:releasable])
+            sent = releasable
+
+    full_response = raw_response.strip()
+    if not full_response or not PromptInjectionDetector.validate_output(full_response, request_id):
+        return None
+
+    if sent < len(raw_response):
+        yield _format_response_chunk(raw_response[sent:])
+    return full_response
+
+
+def _format_response_chunk(chunk: str) -> str:
+    """Wrap a streamed Ollama text chunk as an SSE token frame."""
+    return _sse_frame({"type": "token", "text": chunk})
 
 
 def _generate_chit_chat_response(prompt: str) -> str:
     """Generate simple chit-chat response without LLM"""
-    if "merhaba" in prompt.lower() or "hello" in prompt.lower():
-        return "Merhaba! Ben EBS sistem yöneticisine yardımcı olmak için tasarlanmış bir yapay zekâyım. EBS sisteminde herhangi bir sorunuz var mı?"
-    elif "nasılsın" in prompt.lower() or "how are you" in prompt.lower():
-        return "İyiyim, teşekkür ederim! EBS sistemine dair sorularınızı yanıtlamak için buradayım."
-    elif "teşekkür" in prompt.lower() or "thank" in prompt.lower():
-        return "Rica ederim! Başka bir şey ile yardımcı olabilir miyim?"
-    else:
-        return "Bana EBS sistemi hakkında sorularınızı sorun. Concurrent Manager, Invalid Objects, ADOP durumu veya Workflow hakkında bilgi almak isteyebilirsiniz."
+    prompt_lower = prompt.lower()
+    for needles, reply in _CHIT_CHAT_REPLIES:
+        if any(needle in prompt_lower for needle in needles):
+            return reply
+    return _CHIT_CHAT_DEFAULT_REPLY
 
 
 def _generate_fallback_summary(exec_result, control: 'ControlDefinition' = None):
@@ -517,45 +1069,55 @@ def _format_response(summary_response, request_id: str = None) -> str:
     
     Per AGENTS.md § 7.3: Output must be concise, actionable, and user-friendly.
     Converts verdict enum to Turkish display text.
+
+    Thin adapter: flattens the summary to hashable parts so identical
+    summaries (common once the summary/response caches are warm) reuse the
+    memoized markdown from _render_summary_markdown().
     """
-    lines = []
+    # Handle both enum and string verdict
+    verdict_key = _verdict_value(summary_response.verdict)
+    return _render_summary_markdown(
+        verdict_key,
+        tuple(summary_response.summary_bullets),
+        tuple(summary_response.evidence or ()),
+        summary_response.details,
+        tuple(summary_response.next_checks or ()),
+    )
+
 
+@functools.lru_cache(maxsize=512)
+def _render_summary_markdown(
+    verdict_key: str,
+    summary_bullets: tuple,
+    evidence: tuple,
+    details: Optional[str],
+    next_checks: tuple,
+) -> str:
+    """Build the markdown for one summary (memoized on its contents)."""
     # Verdict as emoji + Turkish label (no Request ID - already in JSON response)
-    verdict_display = {
-        "OK": ("✓", "Normal"),
-        "WARN": ("⚠️", "Dikkat Gerekli"),
-        "CRIT": ("🔴", "Kritik Durum"),
-        "UNKNOWN": ("❓", "Bilinmeyen")
-    }
-    
-    # Handle both enum and string verdict
-    verdict_key = summary_response.verdict.value if hasattr(summary_response.verdict, 'value') else str(summary_response.verdict)
-    emoji, label = verdict_display.get(verdict_key, ("❓", "Bilinmeyen"))
+    emoji, label = _VERDICT_DISPLAY.get(verdict_key, _VERDICT_DISPLAY["UNKNOWN"])
 
     # Simple header - UI already displays verdict field separately
-    lines.append(f"**{emoji} {label}**\n")
+    lines = [f"**{emoji} {label}**\n"]
 
     # Summary bullets
-    for bullet in summary_response.summary_bullets:
-        lines.append(f"- {bullet}")
+    lines.extend(f"- {bullet}" for bullet in summary_bullets)
 
     # Evidence (compact, no extra line before)
-    if summary_response.evidence:
+    if evidence:
         lines.append("")
         lines.append("**Teknik Detaylar:**")
-        for evidence in summary_response.evidence:
-            lines.append(f"  • {evidence}")
+        lines.extend(f"  • {item}" for item in evidence)
 
     # Details if present
-    if summary_response.details:
+    if details:
         lines.append("")
-        lines.append(summary_response.details)
+        lines.append(details)
     
     # Next steps if present
-    if summary_response.next_checks:
+    if next_checks:
         lines.append("")
         lines.append("**Önerilen Aksiyonlar:**")
-        for step in summary_response.next_checks:
-            lines.append(f"  ✓ {step}")
+        lines.extend(f"  ✓ {step}" for step in next_checks)
     
     return "\n".join(lines)
@@ -60,7 +60,9 @@ async function sendMessage() {
         showTypingIndicator();
         
         const startTime = performance.now();
-        const response = await fetch(`${API_BASE}/chat`, {
+        // Streaming endpoint (SSE over POST): tokens are shown as they arrive.
+        // EventSource only supports GET, so frames are read from fetch's body.
+        const response = await fetch(`${API_BASE}/chat/stream`, {
             method: "POST",
             headers: {
                 "Content-Type": "application/json",
@@ -71,34 +73,50 @@ async function sendMessage() {
             })
         });
         
-        const endTime = performance.now();
-        const duration = (endTime - startTime).toFixed(0);
-        
         if (!response.ok) {
             const error = await response.json();
             addMessage("system", `❌ Hata: ${error.error || "Bilinmeyen hata"}`);
             return;
         }
         
-        const data = await response.json();
-        
-        // Add assistant response
-        const assistantMsg = `
-            <p><strong>${data.verdict}</strong> <span class="message-verdict verdict-${data.verdict.toLowerCase()}">${getVerdictEmoji(data.verdict)} ${data.verdict}</span></p>
-            <p>${data.response}</p>
-            <small>Request ID: <code>${data.request_id}</code></small>
-        `;
+        let streamEl = null;
+        let streamedText = "";
         
-        addMessage("assistant", assistantMsg);
-        
-        // Show response time
-        const responseTimeEl = document.getElementById("response-time");
-        responseTimeEl.textContent = `⏱ ${duration}ms`;
-        
-        // Update details panel with raw data
-        if (data.raw_data && data.raw_data.length > 0) {
-            updateDetailsPanel(data);
-        }
+        await readEventStream(response, (event) => {
+            if (event.type === "token") {
+                if (!streamEl) {
+                    hideTypingIndicator();
+                    streamEl = addMessage("assistant", "<p class=\"streaming\"></p>");
+                }
+                streamedText += event.text;
+                streamEl.querySelector(".streaming").textContent = streamedText;
+            } else if (event.type === "done") {
+                const duration = (performance.now() - startTime).toFixed(0);
+                const assistantMsg = `
+                    <p><strong>${event.verdict}</strong> <span class="message-verdict verdict-${event.verdict.toLowerCase()}">${getVerdictEmoji(event.verdict)} ${event.verdict}</span></p>
+                    <p>${event.response}</p>
+                    <small>Request ID: <code>${event.request_id}</code></small>
+                `;
+                
+                // Replace raw streamed tokens with the validated, formatted response
+                if (streamEl) {
+                    streamEl.querySelector(".message-content").innerHTML = assistantMsg;
+                } else {
+                    addMessage("assistant", assistantMsg);
+                }
+                
+                // Show response time
+                const responseTimeEl = document.getElementById("response-time");
+                responseTimeEl.textContent = `⏱ ${duration}ms`;
+                
+                // Update details panel with raw data
+                if (event.raw_data && event.raw_data.length > 0) {
+                    updateDetailsPanel(event);
+                }
+            } else if (event.type === "error") {
+                addMessage("system", `❌ Hata: ${event.error || "Bilinmeyen hata"}`);
+            }
+        });
         
     } catch (err) {
         console.error("Error sending message:", err);
@@ -128,6 +146,30 @@ function addMessage(type, content) {
     
     // Scroll to bottom
     container.scrollTop = container.scrollHeight;
+    return messageEl;
+}
+
+// ===== STREAMING =====
+async function readEventStream(response, onEvent) {
+    // Parse "data: {json}\n\n" frames from a text/event-stream body
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        
+        let sep;
+        while ((sep = buffer.indexOf("\n\n")) !== -1) {
+            const frame = buffer.slice(0, sep);
+            buffer = buffer.slice(sep + 2);
+            if (frame.startsWith("data: ")) {
+                onEvent(JSON.parse(frame.slice(6)));
+            }
+        }
+    }
 }
 
 function showTypingIndicator() {
@@ -3,12 +3,26 @@ Test rate limiting implementation.
 Validates that requests are limited per IP address.
 """
 
+import os
 import time
 from unittest.mock import Mock, MagicMock
+
+import pytest
 from flask import Flask, jsonify
 from src.web.middleware import setup_rate_limiter
 
 
+@pytest.fixture(params=["memory://", "redis"])
+def storage_uri(request):
+    """Limiter storage backends; Redis runs only when TEST_REDIS_URI is set"""
+    if request.param == "memory://":
+        return request.param
+    uri = os.getenv("TEST_REDIS_URI")
+    if not uri:
+        pytest.skip("TEST_REDIS_URI not set")
+    return uri
+
+
 def test_rate_limiter_setup():
     """Test rate limiter initialization"""
     print("✓ Testing rate limiter setup...")
@@ -20,11 +34,12 @@ def test_rate_limiter_setup():
     limiter = setup_rate_limiter(app)
     
     assert limiter is not None
+    assert setup_rate_limiter(app) is limiter, "Second setup should reuse the limiter"
     print("  ✓ Rate limiter initialized")
     print()
 
 
-def test_rate_limit_enforcement():
+def test_rate_limit_enforcement(storage_uri):
     """Test that rate limits are enforced"""
     print("✓ Testing rate limit enforcement...")
     
@@ -39,7 +54,9 @@ def test_rate_limit_enforcement():
         app=app,
         key_func=get_remote_address,
         default_limits=["5 per minute"],  # Stricter for testing
-        storage_uri="memory://",
+        storage_uri=storage_uri,
+        strategy="fixed-window",
+        key_prefix=f"test-{os.getpid()}-{time.monotonic_ns()}",
     )
     
     @app.route('/test')
@@ -77,7 +94,7 @@ def test_rate_limit_enforcement():
     print()
 
 
-def test_rate_limit_per_ip():
+def test_rate_limit_per_ip(storage_uri):
     """Test that rate limits are per IP address"""
     print("✓ Testing per-IP rate limiting...")
     
@@ -91,7 +108,9 @@ def test_rate_limit_per_ip():
         app=app,
         key_func=get_remote_address,
         default_limits=["3 per minute"],
-        storage_uri="memory://",
+        storage_uri=storage_uri,
+        strategy="fixed-window",
+        key_prefix=f"test-{os.getpid()}-{time.monotonic_ns()}",
     )
     
     @app.route('/test')
@@ -171,8 +190,8 @@ if __name__ == "__main__":
             exit(1)
         
         test_rate_limiter_setup()
-        test_rate_limit_enforcement()
-        test_rate_limit_per_ip()
+        test_rate_limit_enforcement("memory://")
+        test_rate_limit_per_ip("memory://")
         test_rate_limit_window_reset()
         test_security_audit_log()
         
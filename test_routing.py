@@ -29,8 +29,7 @@ test_prompts = [
 ]
 
 print(f'\n--- Testing Intent Classification ---')
-for prompt in test_prompts:
-    result = classifier.classify(prompt)
+for prompt, result in zip(test_prompts, classifier.classify_batch(test_prompts)):
     print(f'\nPrompt: "{prompt}"')
     print(f'  Intent: {result.intent}')
     print(f'  Confidence: {result.confidence:.2%}')
@@ -21,9 +21,11 @@ def test_timeout_enforcement():
     mock_pool.get_connection.return_value = mock_conn
     mock_conn.cursor.return_value = mock_cursor
     
-    # Simulate a slow query (takes 5 seconds)
+    # Simulate a slow query (takes 5 seconds unless released)
+    release = threading.Event()
+
     def slow_execute(*args, **kwargs):
-        time.sleep(5)
+        release.wait(timeout=5)
     
     mock_cursor.execute = slow_execute
     
@@ -32,13 +34,15 @@ def test_timeout_enforcement():
     # Test 1: Query that times out (timeout=1s, query takes 5s)
     print("  Testing timeout (1s timeout, 5s query)...")
     try:
-        start = time.time()
+        start = time.perf_counter()
         executor._execute_with_timeout(mock_cursor, "SELECT 1", None, timeout_seconds=1)
         assert False, "Should have raised TimeoutError"
     except TimeoutError as e:
-        elapsed = time.time() - start
+        elapsed = time.perf_counter() - start
         print(f"  ✓ Query timed out after {elapsed:.2f}s (expected ~1s): {e}")
         assert elapsed < 2, f"Timeout took too long: {elapsed}s"
+    finally:
+        release.set()  # Don't leave the query thread sleeping
     
     print()
 
@@ -61,9 +65,9 @@ def test_fast_query_no_timeout():
     executor = QueryExecutor(mock_pool)
     
     # Test: Fast query completes within timeout
-    start = time.time()
+    start = time.perf_counter()
     executor._execute_with_timeout(mock_cursor, "SELECT 1", None, timeout_seconds=5)
-    elapsed = time.time() - start
+    elapsed = time.perf_counter() - start
     
     print(f"  ✓ Query completed in {elapsed:.2f}s (well under 5s timeout)")
     assert elapsed < 1, "Should complete almost instantly"
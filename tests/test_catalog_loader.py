@@ -0,0 +1,43 @@
+"""
+Test Suite for control catalog loading.
+Per AGENTS.md § 4 (Control Catalog Rules).
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from src.controls.loader import load_catalog, CatalogLoadError
+
+CONTROLS_DIR = Path(__file__).resolve().parent.parent / "knowledge" / "controls"
+
+
+class TestLoadCatalog:
+    """Test load_catalog reuse and invalidation"""
+
+    @pytest.fixture
+    def catalog_dir(self, tmp_path):
+        shutil.copy(CONTROLS_DIR / "invalid_objects.json", tmp_path)
+        return tmp_path
+
+    def test_unchanged_directory_reuses_catalog(self, catalog_dir):
+        """Second load of an unchanged directory returns the same catalog"""
+        assert load_catalog(str(catalog_dir)) is load_catalog(str(catalog_dir))
+
+    def test_modified_file_reloads_catalog(self, catalog_dir):
+        """Touching a control file invalidates the cached catalog"""
+        first = load_catalog(str(catalog_dir))
+        control_file = catalog_dir / "invalid_objects.json"
+        stat = control_file.stat()
+        os.utime(control_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = load_catalog(str(catalog_dir))
+
+        assert second is not first
+        assert second.controls.keys() == first.controls.keys()
+
+    def test_missing_directory_raises(self, tmp_path):
+        """Missing directories still raise CatalogLoadError"""
+        with pytest.raises(CatalogLoadError):
+            load_catalog(str(tmp_path / "missing"))
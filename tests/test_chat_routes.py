@@ -0,0 +1,212 @@
+"""
+Test Suite for the chat endpoints (/api/chat, /api/chat/stream).
+Per AGENTS.md § 3.1 (Web layer).
+"""
+
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from flask import Flask
+from src.controls.loader import load_catalog
+from src.controls.schema import ControlExecutionResult, QueryExecutionResult
+from src.intent.classifier import IntentClassifier
+from src.intent.router import ScoreBasedRouter
+from src.llm.client import OllamaClient
+from src.llm.prompt_builder import PromptBuilder
+from src.llm.summary_cache import SummaryCache
+from src.observability.metrics import latency_metrics
+from src.web.response_cache import ExactResponseCache, SemanticResponseCache
+from src.web.routes import register_routes
+
+RAW_SUMMARY = (
+    "**Summary**\n- 1 invalid object\n\n**Verdict** WARN\n\n"
+    "**Evidence**\n- count: 1\n\n**Next Steps**\n- compile"
+)
+CONTROL_PROMPT = "invalid objects var mı?"
+
+
+def _sse_frames(response):
+    """Decode an SSE body into its JSON payloads."""
+    body = response.get_data(as_text=True)
+    return [json.loads(frame[len("data: "):]) for frame in body.split("\n\n") if frame]
+
+
+@pytest.fixture
+def app():
+    """App with the real catalog/classifier/router and mocked DB + Ollama"""
+    app = Flask(__name__)
+    catalog = load_catalog("knowledge/controls")
+    app.config["control_catalog"] = catalog
+    app.config["intent_classifier"] = IntentClassifier(catalog)
+    app.config["score_based_router"] = ScoreBasedRouter(catalog)
+    app.config["prompt_builder"] = PromptBuilder()
+    app.config["summary_cache"] = SummaryCache()
+    app.config["exact_cache"] = ExactResponseCache()
+    app.config["response_cache"] = SemanticResponseCache(
+        dim=len(app.config["intent_classifier"].vectorizer.vocabulary_)
+    )
+
+    def execute_control(control, binds):
+        row = {"object_name": "PKG_A", "created": datetime(2024, 1, 2, 3, 4, 5)}
+        return ControlExecutionResult(
+            control_id=control.control_id,
+            control_version=control.version,
+            intent=control.intent,
+            query_results=[QueryExecutionResult(
+                query_id="q1", rows=[row], row_count=1, truncated=False, execution_time_ms=1.0,
+            )],
+            total_execution_time_ms=1.0,
+            has_errors=False,
+        )
+
+    app.config["query_executor"] = Mock(execute_control=Mock(side_effect=execute_control))
+
+    ollama_client = OllamaClient("http://ollama.invalid", "test-model")
+    ollama_client.stream_summarize = Mock(
+        side_effect=lambda *args: iter([RAW_SUMMARY[:20], RAW_SUMMARY[20:]])
+    )
+    ollama_client.generate_chat_response = Mock(return_value="chat reply")
+    app.config["ollama_client"] = ollama_client
+
+    register_routes(app)
+    return app
+
+
+class TestChatStream:
+    """Test the SSE chat endpoint"""
+
+    def test_datetime_rows_reach_done_frame(self, app):
+        """DATE columns in raw_data are encoded instead of failing the stream"""
+        response = app.test_client().post("/api/chat/stream", json={"prompt": CONTROL_PROMPT})
+
+        frames = _sse_frames(response)
+        assert [f["type"] for f in frames if f["type"] != "token"] == ["intent", "db_done", "done"]
+        assert frames[-1]["raw_data"][0]["created"] == "Tue, 02 Jan 2024 03:04:05 GMT"
+
+    def test_tokens_forward_full_text(self, app):
+        """Held-back tail is flushed once the whole response validates"""
+        response = app.test_client().post("/api/chat/stream", json={"prompt": CONTROL_PROMPT})
+
+        tokens = [f["text"] for f in _sse_frames(response) if f["type"] == "token"]
+        assert "".join(tokens) == RAW_SUMMARY
+
+    def test_leaked_system_prompt_never_streamed(self, app):
+        """A leakage marker split across chunks is not forwarded"""
+        leaked = "**Summary**\n- ok\nYou are an Ora" + "cle EBS assistant. " + "x" * 200
+        app.config["ollama_client"].stream_summarize.side_effect = lambda *args: iter(
+            [leaked[:30], leaked[30:60], leaked[60:]]
+        )
+
+        frames = _sse_frames(
+            app.test_client().post("/api/chat/stream", json={"prompt": CONTROL_PROMPT})
+        )
+
+        streamed = "".join(f["text"] for f in frames if f["type"] == "token")
+        assert "Oracle" not in streamed and "You are" not in streamed
+        assert frames[-1]["type"] == "done"
+        assert "Oracle EBS" not in frames[-1]["response"]
+
+    @pytest.mark.parametrize("prompt", [123, None, ["invalid objects"]])
+    def test_non_string_prompt_rejected(self, app, prompt):
+        """Non-str prompts get the 400 JSON error, not an unhandled 500"""
+        response = app.test_client().post("/api/chat/stream", json={"prompt": prompt})
+
+        assert response.status_code == 400
+        assert response.get_json()["error"] == "Lütfen bir soru sorun."
+
+    @pytest.mark.parametrize("prompt,intent", [("merhaba", "chit_chat"), (CONTROL_PROMPT, "ebs_control")])
+    def test_exits_recorded_in_metrics(self, app, prompt, intent):
+        """Stream requests count toward /api/metrics like /api/chat ones"""
+        before = latency_metrics.snapshot()["requests_by_intent"][intent]
+
+        _sse_frames(app.test_client().post("/api/chat/stream", json={"prompt": prompt}))
+
+        assert latency_metrics.snapshot()["requests_by_intent"][intent] == before + 1
+
+
+class TestChatEncoding:
+    """Test that every /api/chat exit uses the shared compact encoder"""
+
+    @pytest.mark.parametrize(
+        "decision",
+        [
+            # Low router score -> Ollama chat
+            SimpleNamespace(
+                selected_control_id=None, confidence=0.0,
+                ambiguity_threshold_breach=False, suggested_interpretations=[],
+            ),
+            # Ambiguous -> clarification
+            SimpleNamespace(
+                selected_control_id="invalid_objects", confidence=0.5,
+                ambiguity_threshold_breach=True, suggested_interpretations=["invalid objects"],
+            ),
+        ],
+    )
+    def test_router_fallbacks_keep_field_order(self, app, decision):
+        """Compact, unsorted bodies (jsonify would sort the keys)"""
+        app.config["score_based_router"] = Mock(route=Mock(return_value=decision))
+
+        raw = app.test_client().post("/api/chat", json={"prompt": CONTROL_PROMPT}).get_data(as_text=True)
+
+        assert raw.startswith('{"request_id":')
+
+
+class TestIntentEndpoint:
+    """Test /api/intent request handling"""
+
+    def test_classifies_prompt(self, app):
+        """Valid prompts are classified"""
+        response = app.test_client().post("/api/intent", json={"prompt": CONTROL_PROMPT})
+
+        assert response.status_code == 200
+        assert response.get_json()["prompt"] == CONTROL_PROMPT
+
+    def test_rejects_like_chat(self, app):
+        """Invalid bodies get the same errors as /api/chat"""
+        client = app.test_client()
+        for body in ("not json", json.dumps({"prompt": ""}), json.dumps({"prompt": "x" * 40000})):
+            intent = client.post("/api/intent", data=body, content_type="application/json")
+            chat = client.post("/api/chat", data=body, content_type="application/json")
+            assert intent.status_code == chat.status_code
+            assert intent.get_json()["error"] == chat.get_json()["error"]
+
+
+class TestResponseCaches:
+    """Test which /api/chat answers the response caches reuse"""
+
+    def test_control_answers_not_semantically_cached(self, app):
+        """Control prompts differing only in unknown words both hit the DB"""
+        client = app.test_client()
+        executor = app.config["query_executor"]
+
+        first = client.post("/api/chat", json={"prompt": "invalid objects nedir"}).get_json()
+        second = client.post("/api/chat", json={"prompt": "invalid objects sayısı"}).get_json()
+
+        assert first["intent"] == second["intent"] == "ebs_control"
+        assert "cache_hit" not in second
+        assert executor.execute_control.call_count == 2
+
+
+    def test_repeated_control_prompt_reruns_db(self, app):
+        """The exact tier never replays control answers"""
+        client = app.test_client()
+
+        client.post("/api/chat", json={"prompt": CONTROL_PROMPT})
+        second = client.post("/api/chat", json={"prompt": CONTROL_PROMPT}).get_json()
+
+        assert "cache_hit" not in second
+        assert app.config["query_executor"].execute_control.call_count == 2
+
+    def test_repeated_chat_prompt_hits_exact_tier(self, app):
+        """Chat answers are replayed from the exact tier"""
+        client = app.test_client()
+
+        first = client.post("/api/chat", json={"prompt": "merhaba"}).get_json()
+        second = client.post("/api/chat", json={"prompt": "merhaba"}).get_json()
+
+        assert first["intent"] == "chit_chat"
+        assert second["cache_hit"] == "exact"
+        assert second["cached_at"] == first["timestamp"]
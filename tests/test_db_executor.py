@@ -10,6 +10,12 @@ Tests:
 5. Timeout handling
 """
 
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import oracledb
 import pytest
 from src.db.executor import QueryExecutor
 from src.db.sanitizer import Sanitizer
@@ -32,11 +38,24 @@ class TestSQLValidation:
     )
     def test_forbidden_operations(self, dangerous_sql):
         """Test that DDL/DML operations are blocked"""
-        executor = QueryExecutor(None)
-        error = executor._validate_sql(dangerous_sql)
+        error = QueryExecutor._validate_sql(dangerous_sql)
         assert error is not None, f"Should block: {dangerous_sql}"
         assert "Only SELECT" in error
 
+    @pytest.mark.parametrize(
+        "dangerous_sql,keyword",
+        [
+            ("SELECT 1 FROM dual; MERGE INTO apps.fnd_user u USING dual ON (1=1)", "MERGE"),
+            ("SELECT 1 FROM dual; EXEC dbms_lock.sleep(60)", "EXEC"),
+            ("SELECT 1 FROM dual; EXECUTE IMMEDIATE :stmt", "EXECUTE"),
+        ],
+    )
+    def test_forbidden_keyword_after_select(self, dangerous_sql, keyword):
+        """Test that the matched keyword itself is reported"""
+        error = QueryExecutor._validate_sql(dangerous_sql)
+        assert error is not None, f"Should block: {dangerous_sql}"
+        assert f"keyword detected: {keyword}." in error
+
     @pytest.mark.parametrize(
         "safe_sql",
         [
@@ -48,14 +67,12 @@ class TestSQLValidation:
     )
     def test_allowed_selects(self, safe_sql):
         """Test that SELECT statements are allowed"""
-        executor = QueryExecutor(None)
-        error = executor._validate_sql(safe_sql)
+        error = QueryExecutor._validate_sql(safe_sql)
         assert error is None, f"Should allow: {safe_sql}"
 
     def test_empty_sql(self):
         """Test empty SQL rejection"""
-        executor = QueryExecutor(None)
-        error = executor._validate_sql("")
+        error = QueryExecutor._validate_sql("")
         assert error is not None
         assert "Empty" in error
 
@@ -101,6 +118,29 @@ class TestResultSanitization:
         assert len(description) < 1000
         assert result["truncation_count"] == 1
 
+    def test_misdeclared_text_column_truncated(self):
+        """Test that strings in a DATE-declared column (e.g. TO_CHAR) are still capped"""
+        rows = [{"created": "d" * 600} for _ in range(2)]
+        schema = [{"name": "created", "type": "DATE", "sensitive": False}]
+
+        result = Sanitizer.sanitize_result(rows, schema)
+
+        assert all(row["created"].endswith(Sanitizer.TRUNCATION_MARKER) for row in result["rows"])
+        assert result["truncation_count"] == 2
+
+    def test_tuple_rows_match_dict_rows(self):
+        """Test that cursor tuples sanitize exactly like the equivalent dicts"""
+        col_names = ["id", "password", "note"]
+        tuples = [(i, "secret", "n" * (600 if i % 2 else 10)) for i in range(80)]
+        schema = [{"name": "password", "type": "VARCHAR2", "sensitive": True}]
+
+        result = Sanitizer.sanitize_result_tuples(col_names, tuples, schema)
+
+        dict_rows = [dict(zip(col_names, row)) for row in tuples]
+        assert result == Sanitizer.sanitize_result(dict_rows, schema)
+        assert len(result["rows"]) == Sanitizer.MAX_ROWS
+        assert result["row_count"] == 80
+
     def test_row_capping(self):
         """Test that rows are capped at MAX_ROWS"""
         rows = [{"id": i, "data": f"row_{i}"} for i in range(100)]
@@ -132,7 +172,6 @@ class TestBindValidation:
 
     def test_valid_binds(self):
         """Test validation of valid bind parameters"""
-        executor = QueryExecutor(None)
         binds = {"p_user_id": 500, "p_status": "ACTIVE"}
         bind_schema = [
             {"name": "p_user_id", "type": "NUMBER", "optional": False},
@@ -140,11 +179,10 @@ class TestBindValidation:
         ]
 
         # Should not raise
-        executor._validate_binds(binds, bind_schema)
+        QueryExecutor._validate_binds(binds, bind_schema)
 
     def test_missing_required_bind(self):
         """Test missing required bind parameter"""
-        executor = QueryExecutor(None)
         binds = {"p_user_id": 500}  # Missing p_status
         bind_schema = [
             {"name": "p_user_id", "type": "NUMBER", "optional": False},
@@ -152,11 +190,10 @@ class TestBindValidation:
         ]
 
         with pytest.raises(Exception):
-            executor._validate_binds(binds, bind_schema)
+            QueryExecutor._validate_binds(binds, bind_schema)
 
     def test_optional_bind_missing(self):
         """Test that optional binds can be missing"""
-        executor = QueryExecutor(None)
         binds = {"p_user_id": 500}
         bind_schema = [
             {"name": "p_user_id", "type": "NUMBER", "optional": False},
@@ -164,7 +201,95 @@ class TestBindValidation:
         ]
 
         # Should not raise
-        executor._validate_binds(binds, bind_schema)
+        QueryExecutor._validate_binds(binds, bind_schema)
+
+
+class TestControlExecution:
+    """Test multi-query control execution"""
+
+    @staticmethod
+    def _control(n_queries):
+        query = lambda i: SimpleNamespace(dict=lambda: {"query_id": f"q{i}", "sql": "SELECT 1 FROM dual"})
+        return SimpleNamespace(
+            control_id="test_control",
+            version="1.0",
+            intent="data_integrity",
+            queries=[query(i) for i in range(n_queries)],
+        )
+
+    @staticmethod
+    def _slow_pool():
+        """Pool whose queries sleep 50ms; returns (pool, peak in-flight count)"""
+        in_flight, peak = [0], [0]
+        lock = threading.Lock()
+
+        def slow_execute(*args):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+
+        def new_connection():
+            cursor = Mock(description=[("N",)])
+            cursor.execute.side_effect = slow_execute
+            cursor.fetchmany.return_value = [(1,)]
+            return Mock(cursor=Mock(return_value=cursor))
+
+        pool = Mock()
+        pool.get_connection.side_effect = new_connection
+        return pool, peak
+
+    def test_queries_run_concurrently_in_order(self):
+        """Independent queries overlap, results keep control order"""
+        pool, peak = self._slow_pool()
+        result = QueryExecutor(pool).execute_control(self._control(3))
+
+        assert [qr.query_id for qr in result.query_results] == ["q0", "q1", "q2"]
+        assert not result.has_errors
+        assert peak[0] > 1
+
+    def test_fan_out_capped_per_control(self):
+        """A large control holds at most MAX_PARALLEL_QUERIES connections"""
+        pool, peak = self._slow_pool()
+        result = QueryExecutor(pool).execute_control(self._control(7))
+
+        assert [qr.query_id for qr in result.query_results] == [f"q{i}" for i in range(7)]
+        assert peak[0] == QueryExecutor.MAX_PARALLEL_QUERIES
+        # Wall time, not the sum of the overlapping query times
+        assert result.total_execution_time_ms < sum(
+            qr.execution_time_ms for qr in result.query_results
+        )
+
+    def test_fetch_stops_at_row_limit(self):
+        """Only row_limit + 1 rows are fetched; the extra row flags truncation"""
+        cursor = Mock(description=[("N",)])
+        cursor.fetchmany.return_value = [(i,) for i in range(4)]
+        pool = Mock()
+        pool.get_connection.return_value = Mock(cursor=Mock(return_value=cursor))
+
+        result = QueryExecutor(pool).execute_query(
+            {"query_id": "q", "sql": "SELECT n FROM t", "row_limit": 3}
+        )
+
+        cursor.fetchmany.assert_called_once_with(4)
+        cursor.fetchall.assert_not_called()
+        assert result.row_count == 3
+        assert result.truncated
+
+    def test_oracle_cursor_uses_call_timeout(self):
+        """oracledb cursors are bounded by call_timeout, not a helper thread"""
+        error = oracledb._Error("call timeout of 1000 ms exceeded")
+        error.full_code = "DPI-1067"
+        cursor = Mock(spec=oracledb.Cursor)
+        cursor.connection = Mock(call_timeout=0)
+        cursor.execute.side_effect = oracledb.DatabaseError(error)
+
+        with pytest.raises(TimeoutError):
+            QueryExecutor(None)._execute_with_timeout(cursor, "SELECT 1 FROM dual", None, 1)
+
+        assert cursor.connection.call_timeout == 0
 
 
 if __name__ == "__main__":
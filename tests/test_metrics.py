@@ -0,0 +1,62 @@
+"""
+Test Suite for in-memory latency metrics.
+Per AGENTS.md § 8.2 (Metrics).
+"""
+
+import pytest
+from src.observability.metrics import LatencyRecorder
+
+
+class TestLatencyRecorder:
+    """Test ring buffer recording and aggregation"""
+
+    def test_empty_snapshot(self):
+        """Empty recorder reports zeros without percentiles"""
+        snap = LatencyRecorder(capacity=8).snapshot()
+        assert snap["requests_total"] == 0
+        assert snap["avg_response_time_ms"] == 0
+        assert "p95_response_time_ms" not in snap
+
+    def test_aggregates(self):
+        """Averages and EBS counts reflect recorded requests"""
+        recorder = LatencyRecorder(capacity=8)
+        recorder.record("chit_chat", intent_ms=1, total_ms=10)
+        recorder.record("ebs_control", 1, db_ms=100, ollama_ms=900, total_ms=1010)
+        recorder.record_error()
+
+        snap = recorder.snapshot()
+        assert snap["requests_total"] == 2
+        assert snap["ebs_control_requests"] == 1
+        assert snap["errors"] == 1
+        assert snap["avg_response_time_ms"] == pytest.approx(510, abs=0.1)
+        assert snap["avg_db_time_ms"] == pytest.approx(100, abs=0.1)
+
+    def test_ring_wraps(self):
+        """Window keeps only the most recent CAPACITY records"""
+        recorder = LatencyRecorder(capacity=4)
+        for ms in range(10):
+            recorder.record("unknown", total_ms=ms)
+
+        snap = recorder.snapshot()
+        assert snap["requests_total"] == 10
+        assert snap["window_size"] == 4
+        assert snap["avg_response_time_ms"] == pytest.approx(7.5, abs=0.1)
+
+    def test_intent_counts_are_lifetime(self):
+        """Per-intent totals keep counting after the window wraps"""
+        recorder = LatencyRecorder(capacity=4)
+        for _ in range(6):
+            recorder.record("ebs_control", total_ms=1)
+        recorder.record("chit_chat", total_ms=1)
+        recorder.record("not_an_intent", total_ms=1)
+
+        snap = recorder.snapshot()
+        assert snap["ebs_control_requests"] == 6
+        assert snap["requests_by_intent"] == {
+            "chit_chat": 1, "ebs_control": 6, "ambiguous": 0, "unknown": 1
+        }
+
+    def test_capacity_must_be_power_of_two(self):
+        """Slot masking requires a power-of-two capacity"""
+        with pytest.raises(ValueError):
+            LatencyRecorder(capacity=10)
@@ -0,0 +1,85 @@
+"""
+Test Suite for the /api/chat response caches.
+Per AGENTS.md § 3.1 (Web layer).
+"""
+
+import numpy as np
+from src.web.response_cache import ExactResponseCache, SemanticResponseCache
+
+
+def _unit(*values):
+    vec = np.array(values, dtype=np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+class TestExactResponseCache:
+    """Test normalized-prompt keying, expiry and eviction"""
+
+    def test_normalized_prompt_hits(self):
+        """Case and surrounding whitespace do not change the key"""
+        cache = ExactResponseCache()
+        cache.put(cache.make_key("Adop Status"), {"intent": "ebs_control"})
+        assert cache.get(cache.make_key("  adop status ")) == {"intent": "ebs_control"}
+
+    def test_expired_entry_misses(self):
+        """Entries older than TTL are ignored"""
+        cache = ExactResponseCache(ttl_seconds=-1)
+        cache.put("k", {"intent": "ebs_control"})
+        assert cache.get("k") is None
+
+    def test_lru_eviction(self):
+        """Oldest untouched entry is evicted over capacity"""
+        cache = ExactResponseCache(max_entries=2)
+        cache.put("a", {"id": "a"})
+        cache.put("b", {"id": "b"})
+        cache.get("a")
+        cache.put("c", {"id": "c"})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": "a"}
+
+
+class TestSemanticResponseCache:
+    """Test similarity lookup, expiry and eviction"""
+
+    def test_similar_prompt_hits(self):
+        """Near-identical embedding returns the cached payload"""
+        cache = SemanticResponseCache(dim=3)
+        cache.put(_unit(1, 0, 0), {"intent": "ebs_control"})
+        assert cache.lookup(_unit(1, 0.1, 0)) == {"intent": "ebs_control"}
+
+    def test_dissimilar_prompt_misses(self):
+        """Embedding below threshold is a miss"""
+        cache = SemanticResponseCache(dim=3)
+        cache.put(_unit(1, 0, 0), {"intent": "ebs_control"})
+        assert cache.lookup(_unit(1, 1, 0)) is None
+
+    def test_different_tag_misses(self):
+        """Identical embedding with a different tag is a miss"""
+        cache = SemanticResponseCache(dim=3)
+        cache.put(_unit(1, 0, 0), {"intent": "chit_chat"}, frozenset({"nedir"}))
+        assert cache.lookup(_unit(1, 0, 0), frozenset({"sayısı"})) is None
+        assert cache.lookup(_unit(1, 0, 0), frozenset({"nedir"})) == {"intent": "chit_chat"}
+
+    def test_zero_vector_never_cached(self):
+        """Out-of-vocabulary prompts (all-zero embedding) are skipped"""
+        cache = SemanticResponseCache(dim=3)
+        cache.put(np.zeros(3, dtype=np.float32), {"intent": "ebs_control"})
+        assert cache.lookup(np.zeros(3, dtype=np.float32)) is None
+
+    def test_expired_entry_misses(self):
+        """Entries older than TTL are ignored"""
+        cache = SemanticResponseCache(dim=3, ttl_seconds=-1)
+        cache.put(_unit(1, 0, 0), {"intent": "ebs_control"})
+        assert cache.lookup(_unit(1, 0, 0)) is None
+
+    def test_lru_eviction(self):
+        """When full, the least recently used entry is replaced"""
+        cache = SemanticResponseCache(dim=3, max_entries=2)
+        cache.put(_unit(1, 0, 0), {"id": "a"})
+        cache.put(_unit(0, 1, 0), {"id": "b"})
+        cache.lookup(_unit(1, 0, 0))  # touch "a"
+        cache.put(_unit(0, 0, 1), {"id": "c"})
+
+        assert cache.lookup(_unit(1, 0, 0)) == {"id": "a"}
+        assert cache.lookup(_unit(0, 1, 0)) is None
+        assert cache.lookup(_unit(0, 0, 1)) == {"id": "c"}